@@ -1,8 +1,10 @@
 import logging
+import os
 import platform
 import re
 import shutil
 import subprocess
+import time
 import urllib
 from pathlib import Path
 
@@ -11,8 +13,36 @@ from solidlsp.ls_exceptions import SolidLSPException
 
 log = logging.getLogger(__name__)
 
+_DOTNET_ENV_OVERRIDES = {
+    "DOTNET_SKIP_FIRST_TIME_EXPERIENCE": "1",
+    "DOTNET_CLI_TELEMETRY_OPTOUT": "1",
+    "DOTNET_NOLOGO": "1",
+}
+"""
+environment variables for `dotnet` invocations which disable the first-run experience (which populates local caches)
+and telemetry, neither of which is needed for the runtime queries and installations performed here
+"""
+
+
+def _dotnet_env() -> dict[str, str]:
+    return {**os.environ, **_DOTNET_ENV_OVERRIDES}
+
 
 class DotNETUtil:
+    _RUNTIME_VERSION_PATTERN = re.compile(rb"^Microsoft\.NETCore\.App\s+(\S+)", re.MULTILINE)
+    """
+    pattern matching the lines of the output of `dotnet --list-runtimes` which refer to the .NET runtime, capturing the version
+    """
+    _INSTALLED_VERSIONS_CACHE_TTL = 60.0
+    """
+    the number of seconds for which the installed versions determined for a dotnet executable are reused
+    (limited, because runtimes may be installed or removed while the process is running)
+    """
+    _installed_versions_cache: dict[str, tuple[float, tuple[Version, ...]]] = {}
+    """
+    maps the path of a dotnet executable to the time at which its installed versions were determined and the versions themselves
+    """
+
     def __init__(self, required_version: str, allow_higher_version: bool = True):
         """
         :param required_version: the required .NET runtime version specified as a string (e.g. "10.0" for .NET 10.0)
@@ -24,13 +54,26 @@ class DotNETUtil:
         self._allow_higher_version = allow_higher_version
         self._installed_versions = self._determine_installed_versions()
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Clears the cached installed versions, such that they are determined anew upon the next instantiation
+        """
+        cls._installed_versions_cache.clear()
+
     def _determine_installed_versions(self) -> list[Version]:
         if self._system_dotnet:
+            cached = self._installed_versions_cache.get(self._system_dotnet)
+            if cached is not None and time.monotonic() - cached[0] < self._INSTALLED_VERSIONS_CACHE_TTL:
+                return list(cached[1])
             try:
-                result = subprocess.run([self._system_dotnet, "--list-runtimes"], capture_output=True, text=True, check=True)
-                version_strings = re.findall(r"Microsoft.NETCore.App\s+([^\s]+)", result.stdout)
+                # the output is parsed as bytes, avoiding a locale-dependent decoding of the entire output
+                result = subprocess.run([self._system_dotnet, "--list-runtimes"], capture_output=True, check=True, env=_dotnet_env())
+                version_strings = [v.decode("ascii", errors="replace") for v in self._RUNTIME_VERSION_PATTERN.findall(result.stdout)]
                 log.info("Installed .NET runtime versions: %s", version_strings)
-                return [Version(v) for v in version_strings]
+                versions = [Version(v) for v in version_strings]
+                self._installed_versions_cache[self._system_dotnet] = (time.monotonic(), tuple(versions))
+                return versions
             except:
                 log.warning("Failed to run 'dotnet --list-runtimes' to check .NET version; assuming no installed .NET versions")
                 return []
@@ -138,7 +181,7 @@ class DotNETUtil:
 
             # Run the install script
             log.info("Running .NET install script: %s", cmd)
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True, env=_dotnet_env())
             log.debug(f"Install script output: {result.stdout}")
 
             if not dotnet_exe.exists():
@@ -732,19 +732,28 @@ class CSharpLanguageServer(SolidLanguageServer):
             log.info(f"Successfully installed Roslyn Language Server to {server_dll}")
             return str(server_dll)
 
-        @staticmethod
-        def _extract_language_server(lang_server_dep: RuntimeDependency, package_path: Path, server_dir: Path) -> None:
+        _DEFAULT_EXTRACT_PATH = "lib/net9.0"
+        _ALTERNATIVE_EXTRACT_PATHS = ("tools/net9.0/any", "lib/net9.0", "contentFiles/any/net9.0")
+        """
+        package directories in which the language server files are searched if the dependency's extract path does not exist
+        """
+
+        @classmethod
+        def _get_extract_paths(cls, dependency: RuntimeDependency) -> list[str]:
+            """
+            :return: the package directories which may contain the language server files, in order of preference
+            """
+            return [dependency.extract_path or cls._DEFAULT_EXTRACT_PATH, *cls._ALTERNATIVE_EXTRACT_PATHS]
+
+        @classmethod
+        def _extract_language_server(cls, lang_server_dep: RuntimeDependency, package_path: Path, server_dir: Path) -> None:
             """Extract language server files from downloaded package."""
-            extract_path = lang_server_dep.extract_path or "lib/net9.0"
+            extract_path, *alternative_extract_paths = cls._get_extract_paths(lang_server_dep)
             source_dir = package_path / extract_path
 
             if not source_dir.exists():
                 # Try alternative locations
-                for possible_dir in [
-                    package_path / "tools" / "net9.0" / "any",
-                    package_path / "lib" / "net9.0",
-                    package_path / "contentFiles" / "any" / "net9.0",
-                ]:
+                for possible_dir in [package_path / p for p in alternative_extract_paths]:
                     if possible_dir.exists():
                         source_dir = possible_dir
                         break
@@ -782,8 +791,15 @@ class CSharpLanguageServer(SolidLanguageServer):
                 package_extract_dir = temp_dir / f"{package_name}.{package_version}"
                 package_extract_dir.mkdir(exist_ok=True)
 
-                # Use SafeZipExtractor to handle long paths and skip errors
-                extractor = SafeZipExtractor(archive_path=nupkg_file, extract_dir=package_extract_dir, verbose=False)
+                # Use SafeZipExtractor to handle long paths and skip errors.
+                # Only the directories which may contain the language server are extracted, skipping package metadata
+                # and the files of other target frameworks.
+                extractor = SafeZipExtractor(
+                    archive_path=nupkg_file,
+                    extract_dir=package_extract_dir,
+                    verbose=False,
+                    include_patterns=[f"{p}/*" for p in self._get_extract_paths(dependency)],
+                )
                 extractor.extract_all()
 
                 # Clean up the nupkg file
@@ -859,7 +875,6 @@ class CSharpLanguageServer(SolidLanguageServer):
                 log.warning(f"Failed to install Razor extension: {e}. Razor support will be disabled.")
                 return None
 
-
     def _get_initialize_params(self) -> InitializeParams:
         """
         Returns the initialize params for the Microsoft.CodeAnalysis.LanguageServer.
@@ -299,11 +299,22 @@ class PlatformUtils:
     This class provides utilities for platform detection and identification.
     """
 
+    _platform_id: PlatformId | None = None
+    """
+    the platform id of the current system, which is determined only once (as the detection may spawn subprocesses)
+    """
+
     @classmethod
     def get_platform_id(cls) -> PlatformId:
         """
         Returns the platform id for the current system
         """
+        if cls._platform_id is None:
+            cls._platform_id = cls._determine_platform_id()
+        return cls._platform_id
+
+    @classmethod
+    def _determine_platform_id(cls) -> PlatformId:
         system = platform.system()
         machine = platform.machine()
         bitness = platform.architecture()[0]
@@ -423,3 +434,21 @@ class SymbolUtils:
             if SymbolUtils.symbol_tree_contains_name(symbol["children"], name):
                 return True
         return False
+
+    @staticmethod
+    def symbol_tree_contains_all(roots: list[UnifiedSymbolInformation], names: set[str]) -> set[str]:
+        """
+        Check whether the tree contains symbols with all the given names, traversing the tree at most once
+        (and stopping as soon as all names were found).
+
+        :param roots: the root symbols of the tree
+        :param names: the names to search for (the set is not modified)
+        :return: the set of names for which no symbol was found (empty if all names are contained in the tree)
+        """
+        missing_names = set(names)
+        stack = list(roots)
+        while stack and missing_names:
+            symbol = stack.pop()
+            missing_names.discard(symbol["name"])
+            stack.extend(symbol["children"])
+        return missing_names
@@ -2,8 +2,8 @@ import logging
 import os
 import platform
 import shutil as _sh
-from collections.abc import Iterator
-from contextlib import contextmanager
+from collections.abc import Iterator, Sequence
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +16,7 @@ from serena.project import Project
 from serena.util.file_system import GitignoreParser
 from solidlsp.ls import SolidLanguageServer
 from solidlsp.ls_config import Language, LanguageServerConfig
+from solidlsp.ls_types import Location
 from solidlsp.settings import SolidLSPSettings
 
 from .solidlsp.clojure import is_clojure_cli_available
@@ -49,6 +50,39 @@ def get_repo_path(language: Language) -> Path:
     return Path(__file__).parent / "resources" / "repos" / repo_language / "test_repo"
 
 
+def index_references_by_file_name(refs: list[Location]) -> dict[str, list[int]]:
+    """
+    :param refs: the references, as returned by a request for references
+    :return: a mapping from the name of each file containing references (without the directory) to the (0-based) lines of the references in it
+    """
+    result: dict[str, list[int]] = {}
+    for ref in refs:
+        result.setdefault(os.path.basename(ref["absolutePath"]), []).append(ref["range"]["start"]["line"])
+    return result
+
+
+@contextmanager
+def open_files(ls: SolidLanguageServer, relative_paths: Sequence[str]) -> Iterator[None]:
+    """
+    Keeps the given files open in the language server while the context is active, such that requests made within
+    the context do not open (and parse) them again. Typically used in a class-scoped autouse fixture, e.g.
+
+    ```
+    @pytest.fixture(scope="class", autouse=True)
+    def open_source_files(self, language_server: SolidLanguageServer) -> Iterator[None]:
+        with open_files(language_server, ["main.py", os.path.join("lib", "util.py")]):
+            yield
+    ```
+
+    :param ls: the language server
+    :param relative_paths: the paths of the files to keep open, relative to the repository root
+    """
+    with ExitStack() as stack:
+        for relative_path in relative_paths:
+            stack.enter_context(ls.open_file(relative_path))
+        yield
+
+
 def _create_ls(
     language: Language,
     repo_path: str | None = None,
@@ -142,6 +176,8 @@ def repo_path(request: LanguageParamRequest) -> Path:
 
 
 # Note: using module scope here to avoid restarting LS for each test function but still terminate between test modules
+# When parallelizing with pytest-xdist (`-n auto --dist loadgroup`), the tests of a module may additionally be marked with
+# `@pytest.mark.xdist_group("<language>")`, which assigns them to the same worker, such that the language server is started only once
 @pytest.fixture(scope="module")
 def language_server(request: LanguageParamRequest):
     """Create a language server instance configured for the specified language.
@@ -19,8 +19,7 @@ from test.conftest import get_repo_path, is_ci, language_tests_enabled
 from test.solidlsp import clojure as clj
 
 
-@pytest.fixture
-def serena_config():
+def create_serena_config() -> SerenaConfig:
     """Create an in-memory configuration for tests with test repositories pre-registered."""
     # Create test projects for all supported languages
     test_projects = []
@@ -61,11 +60,17 @@ def serena_config():
     return config
 
 
+@pytest.fixture
+def serena_config() -> SerenaConfig:
+    return create_serena_config()
+
+
 def read_project_file(project: Project, relative_path: str) -> str:
     """Utility function to read a file from the project."""
     file_path = os.path.join(project.project_root, relative_path)
-    with open(file_path, encoding=project.project_config.encoding) as f:
-        return f.read()
+    # read the raw bytes and decode once, avoiding the overhead of the text I/O stack
+    with open(file_path, "rb") as f:
+        return f.read().decode(project.project_config.encoding)
 
 
 @contextmanager
@@ -80,14 +85,14 @@ def project_file_modification_context(serena_agent: SerenaAgent, relative_path:
     try:
         yield
     finally:
-        # Revert to the original content
-        with open(file_path, "w", encoding=project.project_config.encoding) as f:
-            f.write(original_content)
+        # Revert to the original content (written in binary mode, since it was read without newline translation)
+        with open(file_path, "wb") as f:
+            f.write(original_content.encode(project.project_config.encoding))
 
 
-@pytest.fixture
-def serena_agent(request: pytest.FixtureRequest, serena_config) -> Iterator[SerenaAgent]:
-    language = Language(request.param)
+@contextmanager
+def serena_agent_context(language: Language, serena_config: SerenaConfig) -> Iterator[SerenaAgent]:
+    """Context manager providing an agent for the test repository of the given language."""
     if not language_tests_enabled(language):
         pytest.skip(f"Tests for language {language} are not enabled.")
 
@@ -98,10 +103,17 @@ def serena_agent(request: pytest.FixtureRequest, serena_config) -> Iterator[Sere
     # wait for agent to be ready
     agent.execute_task(lambda: None)
 
-    yield agent
+    try:
+        yield agent
+    finally:
+        # explicitly shut down to free resources
+        agent.shutdown(timeout=5)
 
-    # explicitly shut down to free resources
-    agent.shutdown(timeout=5)
+
+@pytest.fixture
+def serena_agent(request: pytest.FixtureRequest, serena_config) -> Iterator[SerenaAgent]:
+    with serena_agent_context(Language(request.param), serena_config) as agent:
+        yield agent
 
 
 class TestSerenaAgent:
@@ -482,72 +494,55 @@ class TestSerenaAgent:
         with pytest.raises(ValueError, match=match_text):
             replace_symbol_body_tool.apply(name_path=name_path, relative_path=relative_path, body="")
 
-    @pytest.mark.parametrize(
-        "serena_agent",
-        [
-            pytest.param(
-                Language.TYPESCRIPT,
-                marks=pytest.mark.typescript,
-            ),
-        ],
-        indirect=["serena_agent"],
-    )
+
+@pytest.mark.typescript
+class TestReplaceContentTypeScript:
+    """
+    Tests for ReplaceContentTool on the TypeScript test repository.
+    The tests share a single (class-scoped) agent, such that the language server is started only once.
+    """
+
+    RELATIVE_PATH = "ws_manager.js"
+
+    @pytest.fixture(scope="class")
+    def serena_agent(self) -> Iterator[SerenaAgent]:
+        with serena_agent_context(Language.TYPESCRIPT, create_serena_config()) as agent:
+            yield agent
+
     def test_replace_content_regex_with_wildcard_ok(self, serena_agent: SerenaAgent):
         """
         Tests a regex-based content replacement that has a unique match
         """
-        relative_path = "ws_manager.js"
-        with project_file_modification_context(serena_agent, relative_path):
+        with project_file_modification_context(serena_agent, self.RELATIVE_PATH):
             replace_content_tool = serena_agent.get_tool(ReplaceContentTool)
             result = replace_content_tool.apply(
                 needle=r'catch \(error\) \{\s*console.error\("Failed to connect.*?\}',
                 repl='catch(error) { console.log("Never mind"); }',
-                relative_path=relative_path,
+                relative_path=self.RELATIVE_PATH,
                 mode="regex",
             )
             assert result == SUCCESS_RESULT
 
-    @pytest.mark.parametrize(
-        "serena_agent",
-        [
-            pytest.param(
-                Language.TYPESCRIPT,
-                marks=pytest.mark.typescript,
-            ),
-        ],
-        indirect=["serena_agent"],
-    )
     @pytest.mark.parametrize("mode", ["literal", "regex"])
     def test_replace_content_with_backslashes(self, serena_agent: SerenaAgent, mode: Literal["literal", "regex"]):
         """
         Tests a content replacement where the needle and replacement strings contain backslashes.
         This is a regression test for escaping issues.
         """
-        relative_path = "ws_manager.js"
         needle = r'console.log("WebSocketManager initializing\nStatus OK");'
         repl = r'console.log("WebSocketManager initialized\nAll systems go!");'
         replace_content_tool = serena_agent.get_tool(ReplaceContentTool)
-        with project_file_modification_context(serena_agent, relative_path):
+        with project_file_modification_context(serena_agent, self.RELATIVE_PATH):
             result = replace_content_tool.apply(
                 needle=re.escape(needle) if mode == "regex" else needle,
                 repl=repl,
-                relative_path=relative_path,
+                relative_path=self.RELATIVE_PATH,
                 mode=mode,
             )
             assert result == SUCCESS_RESULT
-            new_content = read_project_file(serena_agent.get_active_project(), relative_path)
+            new_content = read_project_file(serena_agent.get_active_project(), self.RELATIVE_PATH)
             assert repl in new_content
 
-    @pytest.mark.parametrize(
-        "serena_agent",
-        [
-            pytest.param(
-                Language.TYPESCRIPT,
-                marks=pytest.mark.typescript,
-            ),
-        ],
-        indirect=["serena_agent"],
-    )
     def test_replace_content_regex_with_wildcard_ambiguous(self, serena_agent: SerenaAgent):
         """
         Tests that an ambiguous replacement where there is a larger match that internally contains
@@ -558,6 +553,6 @@ class TestSerenaAgent:
             replace_content_tool.apply(
                 needle=r'catch \(error\) \{.*?this\.updateConnectionStatus\("Connection failed", false\);.*?\}',
                 repl='catch(error) { console.log("Never mind"); }',
-                relative_path="ws_manager.js",
+                relative_path=self.RELATIVE_PATH,
                 mode="regex",
             )
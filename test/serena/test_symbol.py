@@ -1,3 +1,5 @@
+import functools
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
@@ -8,6 +10,23 @@ from solidlsp import SolidLanguageServer
 from solidlsp.ls_config import Language
 
 
+@functools.cache
+def _get_matcher(name_path_pattern: str, is_substring_match: bool) -> NamePathMatcher:
+    """
+    Returns a (shared) matcher for the given pattern, avoiding repeated pattern parsing across parametrized cases.
+    Sharing is safe, because matchers are not modified by matching.
+    """
+    return NamePathMatcher(name_path_pattern, is_substring_match)
+
+
+@functools.cache
+def _get_components_reversed(name_path_parts: tuple[str, ...]) -> tuple[NamePathComponent, ...]:
+    """
+    Returns the (shared) name path components for the given parts in reverse order.
+    """
+    return tuple(NamePathComponent(part) for part in reversed(name_path_parts))
+
+
 class TestSymbolNameMatching:
     def _create_assertion_error_message(
         self,
@@ -82,8 +101,8 @@ class TestSymbolNameMatching:
     )
     def test_match_simple_name(self, name_path_pattern, symbol_name_path_parts, is_substring_match, expected):
         """Tests matching for simple names (no '/' in pattern)."""
-        symbol_name_path_components = [NamePathComponent(part) for part in symbol_name_path_parts]
-        result = NamePathMatcher(name_path_pattern, is_substring_match).matches_reversed_components(reversed(symbol_name_path_components))
+        components_reversed = _get_components_reversed(tuple(symbol_name_path_parts))
+        result = _get_matcher(name_path_pattern, is_substring_match).matches_reversed_components(iter(components_reversed))
         error_msg = self._create_assertion_error_message(name_path_pattern, symbol_name_path_parts, is_substring_match, expected, result)
         assert result == expected, error_msg
 
@@ -170,8 +189,8 @@ class TestSymbolNameMatching:
     )
     def test_match_name_path_pattern_path_len_2(self, name_path_pattern, symbol_name_path_parts, is_substring_match, expected):
         """Tests matching for qualified names (e.g. 'module/class/func')."""
-        symbol_name_path_components = [NamePathComponent(part) for part in symbol_name_path_parts]
-        result = NamePathMatcher(name_path_pattern, is_substring_match).matches_reversed_components(reversed(symbol_name_path_components))
+        components_reversed = _get_components_reversed(tuple(symbol_name_path_parts))
+        result = _get_matcher(name_path_pattern, is_substring_match).matches_reversed_components(iter(components_reversed))
         error_msg = self._create_assertion_error_message(name_path_pattern, symbol_name_path_parts, is_substring_match, expected, result)
         assert result == expected, error_msg
 
@@ -264,16 +283,23 @@ class TestSymbolDictTypes:
         self.check_key_type(SymbolDTO, SymbolDTOKey)
 
 
-def _make_mock_symbols(count: int, *, relative_path: str = "test_repo/services.py") -> list[MagicMock]:
-    symbols: list[MagicMock] = []
-    for i in range(count):
-        sym = MagicMock()
-        sym.relative_path = relative_path
-        sym.line = i + 1
-        sym.column = 0
-        sym.symbol_root = {}
-        symbols.append(sym)
-    return symbols
+class _FakeSymbol:
+    """
+    Lightweight stand-in for a LanguageServerSymbol, providing only the attributes read by
+    `LanguageServerSymbolRetriever.request_info_for_symbol_batch` (much cheaper than a MagicMock).
+    """
+
+    __slots__ = ("column", "line", "relative_path", "symbol_root")
+
+    def __init__(self, relative_path: str, line: int) -> None:
+        self.relative_path = relative_path
+        self.line = line
+        self.column = 0
+        self.symbol_root: dict = {}
+
+
+def _make_mock_symbols(count: int, *, relative_path: str = "test_repo/services.py") -> list[Any]:
+    return [_FakeSymbol(relative_path, i + 1) for i in range(count)]
 
 
 @pytest.mark.python
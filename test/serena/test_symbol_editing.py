@@ -1,19 +1,24 @@
 """
 Snapshot tests using the (awesome) syrupy pytest plugin https://github.com/syrupy-project/syrupy.
 Recreate the snapshots with `pytest --snapshot-update`.
+
+The tests can be parallelized with pytest-xdist via `pytest -n auto --dist loadgroup`; tests for the same language are then
+run by the same worker, such that each language's repository copy and language server are set up only once.
 """
 
+import difflib
 import logging
 import os
 import shutil
+import stat
 import sys
 import tempfile
 import time
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
-from contextlib import contextmanager
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
-from difflib import SequenceMatcher
+from functools import cached_property
 from pathlib import Path
 from typing import Literal, NamedTuple
 
@@ -22,7 +27,10 @@ from overrides import overrides
 from syrupy import SnapshotAssertion
 
 from serena.code_editor import CodeEditor, LanguageServerCodeEditor
+from solidlsp import SolidLanguageServer
 from solidlsp.ls_config import Language
+from solidlsp.ls_utils import FileUtils
+from solidlsp.lsp_protocol_handler.lsp_constants import LSPConstants
 from src.serena.symbol import LanguageServerSymbolRetriever
 from test.conftest import get_repo_path, start_ls_context
 
@@ -43,6 +51,71 @@ class LineChange(NamedTuple):
     modified_lines: list[str]
 
 
+Opcode = tuple[Literal["equal", "insert", "delete", "replace"], int, int, int, int]
+
+
+def _tokenize_lines(*line_lists: list[str]) -> list[list[int]]:
+    """
+    Maps each line to an integer token, such that lines are equal if and only if their tokens are equal
+    (tokens are assigned via an intern table, so there are no collisions).
+    Diffing the token sequences is cheaper than diffing the lines, as integer comparisons are much faster than string comparisons.
+
+    :param line_lists: the lists of lines to tokenize (sharing one intern table)
+    :return: the token lists, in the order of the given line lists
+    """
+    token_by_line: dict[str, int] = {}
+    return [[token_by_line.setdefault(line, len(token_by_line)) for line in lines] for lines in line_lists]
+
+
+def _matching_blocks(a: Sequence[int], b: Sequence[int]) -> list[tuple[int, int, int]]:
+    """
+    Computes the matching blocks between the two sequences (in the format of `SequenceMatcher.get_matching_blocks`).
+
+    The common prefix and suffix are matched directly, such that the (more expensive) matching only needs to be
+    applied to the middle part, which, for typical edits, is much smaller than the full sequences.
+    """
+    n, m = len(a), len(b)
+    prefix_len = 0
+    while prefix_len < n and prefix_len < m and a[prefix_len] == b[prefix_len]:
+        prefix_len += 1
+    suffix_len = 0
+    while suffix_len < n - prefix_len and suffix_len < m - prefix_len and a[n - 1 - suffix_len] == b[m - 1 - suffix_len]:
+        suffix_len += 1
+
+    a_middle = a[prefix_len : n - suffix_len]
+    b_middle = b[prefix_len : m - suffix_len]
+    middle_blocks = difflib.SequenceMatcher(None, a_middle, b_middle, autojunk=False).get_matching_blocks()
+
+    blocks: list[tuple[int, int, int]] = []
+    if prefix_len:
+        blocks.append((0, 0, prefix_len))
+    # the final (sentinel) block of the middle part is omitted
+    blocks.extend((i + prefix_len, j + prefix_len, size) for i, j, size in middle_blocks[:-1])
+    if suffix_len:
+        blocks.append((n - suffix_len, m - suffix_len, suffix_len))
+    blocks.append((n, m, 0))
+    return blocks
+
+
+def _line_opcodes(a: Sequence[int], b: Sequence[int]) -> list[Opcode]:
+    """
+    Computes the opcodes describing how to turn `a` into `b` (in the format of `SequenceMatcher.get_opcodes`).
+    """
+    opcodes: list[Opcode] = []
+    i = j = 0
+    for block_i, block_j, size in _matching_blocks(a, b):
+        if i < block_i and j < block_j:
+            opcodes.append(("replace", i, block_i, j, block_j))
+        elif i < block_i:
+            opcodes.append(("delete", i, block_i, j, block_j))
+        elif j < block_j:
+            opcodes.append(("insert", i, block_i, j, block_j))
+        i, j = block_i + size, block_j + size
+        if size:
+            opcodes.append(("equal", block_i, i, block_j, j))
+    return opcodes
+
+
 @dataclass
 class CodeDiff:
     """
@@ -53,55 +126,36 @@ class CodeDiff:
     relative_path: str
     original_content: str
     modified_content: str
+    _original_lines: list[str] = field(init=False, repr=False)
+    _modified_lines: list[str] = field(init=False, repr=False)
     _line_changes: list[LineChange] = field(init=False)
 
     def __post_init__(self) -> None:
-        """Compute the diff using difflib's SequenceMatcher."""
-        original_lines = self.original_content.splitlines(keepends=True)
-        modified_lines = self.modified_content.splitlines(keepends=True)
+        """Compute the line-based diff."""
+        self._original_lines = original_lines = self.original_content.splitlines(keepends=True)
+        self._modified_lines = modified_lines = self.modified_content.splitlines(keepends=True)
 
-        matcher = SequenceMatcher(None, original_lines, modified_lines)
         self._line_changes = []
+        if self.original_content == self.modified_content:
+            return
 
-        for tag, orig_start, orig_end, mod_start, mod_end in matcher.get_opcodes():
+        # the diff is computed on integer tokens; the lines themselves are only needed for slicing
+        original_tokens, modified_tokens = _tokenize_lines(original_lines, modified_lines)
+        for tag, orig_start, orig_end, mod_start, mod_end in _line_opcodes(original_tokens, modified_tokens):
             if tag == "equal":
                 continue
-            if tag == "insert":
-                self._line_changes.append(
-                    LineChange(
-                        operation="insert",
-                        original_start=orig_start,
-                        original_end=orig_start,
-                        modified_start=mod_start,
-                        modified_end=mod_end,
-                        original_lines=[],
-                        modified_lines=modified_lines[mod_start:mod_end],
-                    )
-                )
-            elif tag == "delete":
-                self._line_changes.append(
-                    LineChange(
-                        operation="delete",
-                        original_start=orig_start,
-                        original_end=orig_end,
-                        modified_start=mod_start,
-                        modified_end=mod_start,
-                        original_lines=original_lines[orig_start:orig_end],
-                        modified_lines=[],
-                    )
-                )
-            elif tag == "replace":
-                self._line_changes.append(
-                    LineChange(
-                        operation="replace",
-                        original_start=orig_start,
-                        original_end=orig_end,
-                        modified_start=mod_start,
-                        modified_end=mod_end,
-                        original_lines=original_lines[orig_start:orig_end],
-                        modified_lines=modified_lines[mod_start:mod_end],
-                    )
+            # for insertions (deletions), the original (modified) range is empty, so the respective slice is empty, too
+            self._line_changes.append(
+                LineChange(
+                    tag,
+                    orig_start,
+                    orig_end,
+                    mod_start,
+                    mod_end,
+                    original_lines[orig_start:orig_end],
+                    modified_lines[mod_start:mod_end],
                 )
+            )
 
     @property
     def line_changes(self) -> list[LineChange]:
@@ -113,70 +167,223 @@ class CodeDiff:
         """Check if there are any changes."""
         return len(self._line_changes) > 0
 
+    def iter_added_lines(self) -> Iterator[tuple[int, str]]:
+        """Iterate over all added lines with their line numbers (0-based) in the modified file."""
+        for change in self._line_changes:
+            if change.operation in ("insert", "replace"):
+                yield from enumerate(change.modified_lines, start=change.modified_start)
+
+    def iter_deleted_lines(self) -> Iterator[tuple[int, str]]:
+        """Iterate over all deleted lines with their line numbers (0-based) in the original file."""
+        for change in self._line_changes:
+            if change.operation in ("delete", "replace"):
+                yield from enumerate(change.original_lines, start=change.original_start)
+
+    class _LineViews(NamedTuple):
+        added_lines: list[tuple[int, str]]
+        deleted_lines: list[tuple[int, str]]
+        modified_line_numbers: list[int]
+        affected_original_line_numbers: list[int]
+
+    @cached_property
+    def _line_views(self) -> _LineViews:
+        """
+        Computes all line-based views of the changes in a single pass over the line changes.
+        Since the line changes are ordered and non-overlapping, all resulting lists are sorted.
+        """
+        added_lines: list[tuple[int, str]] = []
+        deleted_lines: list[tuple[int, str]] = []
+        modified_line_numbers: list[int] = []
+        affected_original_line_numbers: list[int] = []
+        for change in self._line_changes:
+            if change.operation in ("insert", "replace"):
+                added_lines.extend(enumerate(change.modified_lines, start=change.modified_start))
+                modified_line_numbers.extend(range(change.modified_start, change.modified_end))
+            if change.operation in ("delete", "replace"):
+                deleted_lines.extend(enumerate(change.original_lines, start=change.original_start))
+                affected_original_line_numbers.extend(range(change.original_start, change.original_end))
+        return self._LineViews(added_lines, deleted_lines, modified_line_numbers, affected_original_line_numbers)
+
     @property
     def added_lines(self) -> list[tuple[int, str]]:
         """Get all added lines with their line numbers (0-based) in the modified file."""
-        result = []
-        for change in self._line_changes:
-            if change.operation in ("insert", "replace"):
-                for i, line in enumerate(change.modified_lines):
-                    result.append((change.modified_start + i, line))
-        return result
+        return self._line_views.added_lines
 
     @property
     def deleted_lines(self) -> list[tuple[int, str]]:
         """Get all deleted lines with their line numbers (0-based) in the original file."""
-        result = []
-        for change in self._line_changes:
-            if change.operation in ("delete", "replace"):
-                for i, line in enumerate(change.original_lines):
-                    result.append((change.original_start + i, line))
-        return result
+        return self._line_views.deleted_lines
 
     @property
     def modified_line_numbers(self) -> list[int]:
         """Get all line numbers (0-based) that were modified in the modified file."""
-        line_nums: set[int] = set()
-        for change in self._line_changes:
-            if change.operation in ("insert", "replace"):
-                line_nums.update(range(change.modified_start, change.modified_end))
-        return sorted(line_nums)
+        return self._line_views.modified_line_numbers
 
     @property
     def affected_original_line_numbers(self) -> list[int]:
         """Get all line numbers (0-based) that were affected in the original file."""
-        line_nums: set[int] = set()
-        for change in self._line_changes:
-            if change.operation in ("delete", "replace"):
-                line_nums.update(range(change.original_start, change.original_end))
-        return sorted(line_nums)
+        return self._line_views.affected_original_line_numbers
 
     def get_unified_diff(self, context_lines: int = 3) -> str:
         """Get the unified diff as a string."""
-        import difflib
-
-        original_lines = self.original_content.splitlines(keepends=True)
-        modified_lines = self.modified_content.splitlines(keepends=True)
-
         diff = difflib.unified_diff(
-            original_lines, modified_lines, fromfile=f"a/{self.relative_path}", tofile=f"b/{self.relative_path}", n=context_lines
+            self._original_lines,
+            self._modified_lines,
+            fromfile=f"a/{self.relative_path}",
+            tofile=f"b/{self.relative_path}",
+            n=context_lines,
         )
         return "".join(diff)
 
     def get_context_diff(self, context_lines: int = 3) -> str:
         """Get the context diff as a string."""
-        import difflib
-
-        original_lines = self.original_content.splitlines(keepends=True)
-        modified_lines = self.modified_content.splitlines(keepends=True)
-
         diff = difflib.context_diff(
-            original_lines, modified_lines, fromfile=f"a/{self.relative_path}", tofile=f"b/{self.relative_path}", n=context_lines
+            self._original_lines,
+            self._modified_lines,
+            fromfile=f"a/{self.relative_path}",
+            tofile=f"b/{self.relative_path}",
+            n=context_lines,
         )
         return "".join(diff)
 
 
+ISOLATED_EDITING_TESTS = os.getenv("SERENA_ISOLATED_EDITING_TESTS") == "1"
+"""
+Flag indicating whether each editing test shall use its own copy of the test repository (and its own language server)
+instead of the per-language copy shared across tests; useful for debugging test isolation issues.
+"""
+
+
+def _remove_dir(path: Path, max_attempts: int = 10) -> None:
+    """
+    Removes the given directory, retrying with exponential backoff if removal fails.
+    On Windows, files may remain locked for a short time (e.g. by the terminated language server or by antivirus software),
+    so we retry only when this actually happens instead of waiting unconditionally.
+    Failure to remove the directory after all attempts is logged but not raised.
+    """
+
+    def make_writable_and_retry(func: Callable[[str], object], failed_path: str, _exc: object) -> None:
+        # read-only files cannot be removed on Windows
+        os.chmod(failed_path, stat.S_IWRITE)
+        func(failed_path)
+
+    delay = 0.01
+    for attempt in range(1, max_attempts + 1):
+        try:
+            # onerror is deprecated as of Python 3.12 in favour of onexc (whose handler receives the exception instead of exc_info)
+            if sys.version_info >= (3, 12):
+                shutil.rmtree(path, onexc=make_writable_and_retry)
+            else:
+                shutil.rmtree(path, onerror=make_writable_and_retry)
+            return
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            if attempt == max_attempts:
+                log.warning(f"Failed to remove {path} after {max_attempts} attempts: {e}")
+                return
+            time.sleep(delay)
+            delay *= 2
+
+
+def _sync_file_with_disk(language_server: SolidLanguageServer, rel_path: str) -> None:
+    """
+    Sends the current content of the given file on disk to the language server as a full-document change.
+    Merely reopening the file would not suffice, as an already open buffer (e.g. one held by another user) is reused
+    without re-reading the file.
+
+    :param language_server: the language server
+    :param rel_path: the path of the file, relative to the repository root
+    """
+    with language_server.open_file(rel_path) as file_buffer:
+        contents = FileUtils.read_file(str(file_buffer.abs_path), file_buffer.encoding)
+        file_buffer.contents = contents
+        file_buffer.version += 1
+        language_server.server.notify.did_change_text_document(
+            {
+                LSPConstants.TEXT_DOCUMENT: {  # type: ignore
+                    LSPConstants.VERSION: file_buffer.version,
+                    LSPConstants.URI: file_buffer.uri,
+                },
+                LSPConstants.CONTENT_CHANGES: [{"text": contents}],
+            }
+        )
+
+
+class SharedEditingRepos:
+    """
+    Manages, for each language, a single copy of the test repository along with a running language server,
+    which can be shared by all editing tests (provided that the edited files are restored after each test).
+    """
+
+    def __init__(self, base_dir: Path):
+        self._base_dir = base_dir
+        self._exit_stack = ExitStack()
+        self._language_servers: dict[Language, SolidLanguageServer] = {}
+
+    def get_language_server(self, language: Language) -> SolidLanguageServer:
+        """
+        :param language: the language
+        :return: the language server operating on the shared repository copy for the given language
+            (copying the repository and starting the server upon first use)
+        """
+        if language not in self._language_servers:
+            original_repo_path = get_repo_path(language)
+            repo_path = self._base_dir / str(language) / original_repo_path.name
+            log.info(f"Copying repo from {original_repo_path} to {repo_path}")
+            shutil.copytree(original_repo_path, repo_path)
+            log.info(f"Creating shared language server for {language}")
+            self._language_servers[language] = self._exit_stack.enter_context(start_ls_context(language, str(repo_path)))
+        return self._language_servers[language]
+
+    def close(self) -> None:
+        self._exit_stack.close()
+
+
+def xdist_group(language: Language) -> pytest.MarkDecorator:
+    """
+    :param language: the language
+    :return: the marker which, when using pytest-xdist with `--dist loadgroup`, assigns all editing tests of the given language
+        to the same worker, such that they share the worker's repository copy and language server
+    """
+    return pytest.mark.xdist_group(f"symbol_editing_{language.value}")
+
+
+@pytest.fixture(scope="session")
+def shared_editing_repos(tmp_path_factory: pytest.TempPathFactory) -> Iterator[SharedEditingRepos]:
+    shared_repos = SharedEditingRepos(tmp_path_factory.mktemp("editing_repos"))
+    try:
+        yield shared_repos
+    finally:
+        shared_repos.close()
+
+
+class _RecordingCodeEditor(LanguageServerCodeEditor):
+    """
+    Code editor which records the contents of the files it saves, such that tests need not read them back from disk
+    """
+
+    def __init__(self, symbol_retriever: LanguageServerSymbolRetriever):
+        super().__init__(symbol_retriever)
+        self.saved_contents: dict[str, str] = {}
+        """
+        mapping from relative paths of saved files to their contents (with newlines normalized as when reading in text mode)
+        """
+
+    @overrides
+    def _save_edited_file(self, edited_file: CodeEditor.EditedFile) -> None:
+        super()._save_edited_file(edited_file)
+        contents = edited_file.get_contents()
+        self.saved_contents[edited_file.relative_path] = contents.replace("\r\n", "\n").replace("\r", "\n")
+
+
 class EditingTest(ABC):
+    requires_isolated_repo = False
+    """
+    whether the test must run on a dedicated copy of the repository, because its edits are not (all) saved via the code editor
+    and can thus not be restored in a shared copy
+    """
+
     def __init__(self, language: Language, rel_path: str):
         """
         :param language: the language
@@ -188,7 +395,35 @@ class EditingTest(ABC):
         self.repo_path: Path | None = None
 
     @contextmanager
-    def _setup(self) -> Iterator[LanguageServerSymbolRetriever]:
+    def _setup(self, shared_repos: SharedEditingRepos | None = None) -> Iterator[_RecordingCodeEditor]:
+        """
+        Context manager for setup/teardown, providing the code editor.
+
+        :param shared_repos: the shared repositories to use; if None (or if isolated tests are requested via
+            `ISOLATED_EDITING_TESTS` or required by the test), a temporary copy of the repository and a dedicated
+            language server are used
+        """
+        if shared_repos is None or ISOLATED_EDITING_TESTS or self.requires_isolated_repo:
+            with self._setup_isolated() as symbol_retriever:
+                yield _RecordingCodeEditor(symbol_retriever)
+            return
+
+        language_server = shared_repos.get_language_server(self.language)
+        self.repo_path = Path(language_server.repository_root_path)
+        code_editor = _RecordingCodeEditor(LanguageServerSymbolRetriever(ls=language_server))
+        try:
+            yield code_editor
+        finally:
+            # tests whose edits are not all saved via the code editor (see `requires_isolated_repo`) do not use the shared copy,
+            # so the files saved by the editor are the only ones that need to be restored
+            for rel_path in code_editor.saved_contents:
+                log.info(f"Restoring {rel_path} in {self.repo_path}")
+                shutil.copy2(self.original_repo_path / rel_path, self.repo_path / rel_path)
+                # the language server last saw the edited content
+                _sync_file_with_disk(language_server, rel_path)
+
+    @contextmanager
+    def _setup_isolated(self) -> Iterator[LanguageServerSymbolRetriever]:
         """Context manager for setup/teardown with a temporary directory, providing the symbol manager."""
         temp_dir = Path(tempfile.mkdtemp())
         self.repo_path = temp_dir / self.original_repo_path.name
@@ -196,19 +431,12 @@ class EditingTest(ABC):
         try:
             print(f"Copying repo from {self.original_repo_path} to {self.repo_path}")
             shutil.copytree(self.original_repo_path, self.repo_path)
-            # prevent deadlock on Windows due to file locks caused by antivirus or some other external software
-            # wait for a long time here
-            if os.name == "nt":
-                time.sleep(0.1)
             log.info(f"Creating language server for {self.language} {self.rel_path}")
             with start_ls_context(self.language, str(self.repo_path)) as language_server:
                 yield LanguageServerSymbolRetriever(ls=language_server)
         finally:
-            # prevent deadlock on Windows due to lingering file locks
-            if os.name == "nt":
-                time.sleep(0.1)
             log.info(f"Removing temp directory {temp_dir}")
-            shutil.rmtree(temp_dir, ignore_errors=True)
+            _remove_dir(temp_dir)
             log.info(f"Temp directory {temp_dir} removed")
 
     def _read_file(self, rel_path: str) -> str:
@@ -218,12 +446,18 @@ class EditingTest(ABC):
         with open(file_path, encoding="utf-8") as f:
             return f.read()
 
-    def run_test(self, content_after_ground_truth: SnapshotAssertion) -> None:
-        with self._setup() as symbol_retriever:
+    def run_test(self, content_after_ground_truth: SnapshotAssertion, shared_repos: SharedEditingRepos | None = None) -> None:
+        """
+        :param content_after_ground_truth: the snapshot of the expected file content after the edit
+        :param shared_repos: the shared repositories to use; if None, the test runs on a dedicated copy of the repository
+        """
+        with self._setup(shared_repos) as code_editor:
             content_before = self._read_file(self.rel_path)
-            code_editor = LanguageServerCodeEditor(symbol_retriever)
             self._apply_edit(code_editor)
-            content_after = self._read_file(self.rel_path)
+            # use the content the editor saved (if it edited the file under test) instead of reading it back from disk
+            content_after = code_editor.saved_contents.get(self.rel_path)
+            if content_after is None:
+                content_after = self._read_file(self.rel_path)
             code_diff = CodeDiff(self.rel_path, original_content=content_before, modified_content=content_after)
             self._test_diff(code_diff, content_after_ground_truth)
 
@@ -262,7 +496,7 @@ class DeleteSymbolTest(EditingTest):
                 PYTHON_TEST_REL_FILE_PATH,
                 "VariableContainer",
             ),
-            marks=pytest.mark.python,
+            marks=[pytest.mark.python, xdist_group(Language.PYTHON)],
         ),
         pytest.param(
             DeleteSymbolTest(
@@ -270,12 +504,12 @@ class DeleteSymbolTest(EditingTest):
                 TYPESCRIPT_TEST_FILE,
                 "DemoClass",
             ),
-            marks=pytest.mark.typescript,
+            marks=[pytest.mark.typescript, xdist_group(Language.TYPESCRIPT)],
         ),
     ],
 )
-def test_delete_symbol(test_case, snapshot: SnapshotAssertion):
-    test_case.run_test(content_after_ground_truth=snapshot)
+def test_delete_symbol(test_case, snapshot: SnapshotAssertion, shared_editing_repos: SharedEditingRepos):
+    test_case.run_test(content_after_ground_truth=snapshot, shared_repos=shared_editing_repos)
 
 
 NEW_PYTHON_FUNCTION = """def new_inserted_function():
@@ -336,7 +570,7 @@ class InsertInRelToSymbolTest(EditingTest):
                 "typed_module_var",
                 NEW_PYTHON_VARIABLE,
             ),
-            marks=pytest.mark.python,
+            marks=[pytest.mark.python, xdist_group(Language.PYTHON)],
         ),
         pytest.param(
             InsertInRelToSymbolTest(
@@ -345,7 +579,7 @@ class InsertInRelToSymbolTest(EditingTest):
                 "use_module_variables",
                 NEW_PYTHON_FUNCTION,
             ),
-            marks=pytest.mark.python,
+            marks=[pytest.mark.python, xdist_group(Language.PYTHON)],
         ),
         pytest.param(
             InsertInRelToSymbolTest(
@@ -354,7 +588,7 @@ class InsertInRelToSymbolTest(EditingTest):
                 "DemoClass",
                 NEW_TYPESCRIPT_FUNCTION_AFTER,
             ),
-            marks=pytest.mark.typescript,
+            marks=[pytest.mark.typescript, xdist_group(Language.TYPESCRIPT)],
         ),
         pytest.param(
             InsertInRelToSymbolTest(
@@ -363,35 +597,42 @@ class InsertInRelToSymbolTest(EditingTest):
                 "helperFunction",
                 NEW_TYPESCRIPT_FUNCTION,
             ),
-            marks=pytest.mark.typescript,
+            marks=[pytest.mark.typescript, xdist_group(Language.TYPESCRIPT)],
         ),
     ],
 )
-def test_insert_in_rel_to_symbol(test_case: InsertInRelToSymbolTest, mode: Literal["before", "after"], snapshot: SnapshotAssertion):
+def test_insert_in_rel_to_symbol(
+    test_case: InsertInRelToSymbolTest,
+    mode: Literal["before", "after"],
+    snapshot: SnapshotAssertion,
+    shared_editing_repos: SharedEditingRepos,
+):
     test_case.set_mode(mode)
-    test_case.run_test(content_after_ground_truth=snapshot)
+    test_case.run_test(content_after_ground_truth=snapshot, shared_repos=shared_editing_repos)
 
 
 @pytest.mark.python
-def test_insert_python_class_before(snapshot: SnapshotAssertion):
+@xdist_group(Language.PYTHON)
+def test_insert_python_class_before(snapshot: SnapshotAssertion, shared_editing_repos: SharedEditingRepos):
     InsertInRelToSymbolTest(
         Language.PYTHON,
         PYTHON_TEST_REL_FILE_PATH,
         "VariableDataclass",
         NEW_PYTHON_CLASS_WITH_TRAILING_NEWLINES,
         mode="before",
-    ).run_test(snapshot)
+    ).run_test(snapshot, shared_repos=shared_editing_repos)
 
 
 @pytest.mark.python
-def test_insert_python_class_after(snapshot: SnapshotAssertion):
+@xdist_group(Language.PYTHON)
+def test_insert_python_class_after(snapshot: SnapshotAssertion, shared_editing_repos: SharedEditingRepos):
     InsertInRelToSymbolTest(
         Language.PYTHON,
         PYTHON_TEST_REL_FILE_PATH,
         "VariableDataclass",
         NEW_PYTHON_CLASS_WITH_LEADING_NEWLINES,
         mode="after",
-    ).run_test(snapshot)
+    ).run_test(snapshot, shared_repos=shared_editing_repos)
 
 
 PYTHON_REPLACED_BODY = """def modify_instance_var(self):
@@ -427,7 +668,7 @@ class ReplaceBodyTest(EditingTest):
                 "VariableContainer/modify_instance_var",
                 PYTHON_REPLACED_BODY,
             ),
-            marks=pytest.mark.python,
+            marks=[pytest.mark.python, xdist_group(Language.PYTHON)],
         ),
         pytest.param(
             ReplaceBodyTest(
@@ -436,13 +677,13 @@ class ReplaceBodyTest(EditingTest):
                 "DemoClass/printValue",
                 TYPESCRIPT_REPLACED_BODY,
             ),
-            marks=pytest.mark.typescript,
+            marks=[pytest.mark.typescript, xdist_group(Language.TYPESCRIPT)],
         ),
     ],
 )
-def test_replace_body(test_case: ReplaceBodyTest, snapshot: SnapshotAssertion):
+def test_replace_body(test_case: ReplaceBodyTest, snapshot: SnapshotAssertion, shared_editing_repos: SharedEditingRepos):
     # assert "a" in snapshot
-    test_case.run_test(content_after_ground_truth=snapshot)
+    test_case.run_test(content_after_ground_truth=snapshot, shared_repos=shared_editing_repos)
 
 
 NIX_ATTR_REPLACEMENT = """c = 3;"""
@@ -461,8 +702,9 @@ class NixAttrReplacementTest(EditingTest):
 
 
 @pytest.mark.nix
+@xdist_group(Language.NIX)
 @pytest.mark.skipif(sys.platform == "win32", reason="nixd language server doesn't run on Windows")
-def test_nix_symbol_replacement_no_double_semicolon(snapshot: SnapshotAssertion):
+def test_nix_symbol_replacement_no_double_semicolon(snapshot: SnapshotAssertion, shared_editing_repos: SharedEditingRepos):
     """
     Test that replacing a Nix attribute does not result in double semicolons.
 
@@ -481,10 +723,13 @@ def test_nix_symbol_replacement_no_double_semicolon(snapshot: SnapshotAssertion)
         "testUser",  # Simple attrset with multiple key-value pairs
         NIX_ATTR_REPLACEMENT,
     )
-    test_case.run_test(content_after_ground_truth=snapshot)
+    test_case.run_test(content_after_ground_truth=snapshot, shared_repos=shared_editing_repos)
 
 
 class RenameSymbolTest(EditingTest):
+    # renaming a symbol may entail renaming files, which the code editor does not save and which can thus not be restored
+    requires_isolated_repo = True
+
     def __init__(self, language: Language, rel_path: str, symbol_name: str, new_name: str):
         super().__init__(language, rel_path)
         self.symbol_name = symbol_name
@@ -501,14 +746,15 @@ class RenameSymbolTest(EditingTest):
 
 
 @pytest.mark.python
-def test_rename_symbol(snapshot: SnapshotAssertion):
+@xdist_group(Language.PYTHON)
+def test_rename_symbol(snapshot: SnapshotAssertion, shared_editing_repos: SharedEditingRepos):
     test_case = RenameSymbolTest(
         Language.PYTHON,
         PYTHON_TEST_REL_FILE_PATH,
         "typed_module_var",
         "renamed_typed_module_var",
     )
-    test_case.run_test(content_after_ground_truth=snapshot)
+    test_case.run_test(content_after_ground_truth=snapshot, shared_repos=shared_editing_repos)
 
 
 # ===== VUE WRITE OPERATIONS TESTS =====
@@ -531,12 +777,12 @@ NEW_VUE_HANDLER = """const handleDoubleClick = () => {
                 VUE_TEST_FILE,
                 "handleMouseEnter",
             ),
-            marks=pytest.mark.vue,
+            marks=[pytest.mark.vue, xdist_group(Language.VUE)],
         ),
     ],
 )
-def test_delete_symbol_vue(test_case: DeleteSymbolTest, snapshot: SnapshotAssertion) -> None:
-    test_case.run_test(content_after_ground_truth=snapshot)
+def test_delete_symbol_vue(test_case: DeleteSymbolTest, snapshot: SnapshotAssertion, shared_editing_repos: SharedEditingRepos) -> None:
+    test_case.run_test(content_after_ground_truth=snapshot, shared_repos=shared_editing_repos)
 
 
 @pytest.mark.parametrize("mode", ["before", "after"])
@@ -550,7 +796,7 @@ def test_delete_symbol_vue(test_case: DeleteSymbolTest, snapshot: SnapshotAssert
                 "handleClick",
                 NEW_VUE_HANDLER,
             ),
-            marks=pytest.mark.vue,
+            marks=[pytest.mark.vue, xdist_group(Language.VUE)],
         ),
     ],
 )
@@ -558,9 +804,10 @@ def test_insert_in_rel_to_symbol_vue(
     test_case: InsertInRelToSymbolTest,
     mode: Literal["before", "after"],
     snapshot: SnapshotAssertion,
+    shared_editing_repos: SharedEditingRepos,
 ) -> None:
     test_case.set_mode(mode)
-    test_case.run_test(content_after_ground_truth=snapshot)
+    test_case.run_test(content_after_ground_truth=snapshot, shared_repos=shared_editing_repos)
 
 
 VUE_REPLACED_HANDLECLICK_BODY = """const handleClick = () => {
@@ -581,12 +828,12 @@ VUE_REPLACED_HANDLECLICK_BODY = """const handleClick = () => {
                 "handleClick",
                 VUE_REPLACED_HANDLECLICK_BODY,
             ),
-            marks=pytest.mark.vue,
+            marks=[pytest.mark.vue, xdist_group(Language.VUE)],
         ),
     ],
 )
-def test_replace_body_vue(test_case: ReplaceBodyTest, snapshot: SnapshotAssertion) -> None:
-    test_case.run_test(content_after_ground_truth=snapshot)
+def test_replace_body_vue(test_case: ReplaceBodyTest, snapshot: SnapshotAssertion, shared_editing_repos: SharedEditingRepos) -> None:
+    test_case.run_test(content_after_ground_truth=snapshot, shared_repos=shared_editing_repos)
 
 
 VUE_REPLACED_PRESSCOUNT_BODY = """const pressCount = ref(100)"""
@@ -602,11 +849,13 @@ VUE_REPLACED_PRESSCOUNT_BODY = """const pressCount = ref(100)"""
                 "pressCount",
                 VUE_REPLACED_PRESSCOUNT_BODY,
             ),
-            marks=pytest.mark.vue,
+            marks=[pytest.mark.vue, xdist_group(Language.VUE)],
         ),
     ],
 )
-def test_replace_body_vue_with_disambiguation(test_case: ReplaceBodyTest, snapshot: SnapshotAssertion) -> None:
+def test_replace_body_vue_with_disambiguation(
+    test_case: ReplaceBodyTest, snapshot: SnapshotAssertion, shared_editing_repos: SharedEditingRepos
+) -> None:
     """Test symbol disambiguation when replacing body in Vue files.
 
     This test verifies the fix for the Vue LSP symbol duplication issue.
@@ -618,7 +867,7 @@ def test_replace_body_vue_with_disambiguation(test_case: ReplaceBodyTest, snapsh
     _find_unique_symbol and should correctly select the definition (line 40, 19 chars) over
     the reference (line 97, 10 chars).
     """
-    test_case.run_test(content_after_ground_truth=snapshot)
+    test_case.run_test(content_after_ground_truth=snapshot, shared_repos=shared_editing_repos)
 
 
 VUE_STORE_REPLACED_CLEAR_BODY = """function clear() {
@@ -641,10 +890,12 @@ VUE_STORE_REPLACED_CLEAR_BODY = """function clear() {
                 "clear",
                 VUE_STORE_REPLACED_CLEAR_BODY,
             ),
-            marks=pytest.mark.vue,
+            marks=[pytest.mark.vue, xdist_group(Language.VUE)],
         ),
     ],
 )
-def test_replace_body_vue_ts_file(test_case: ReplaceBodyTest, snapshot: SnapshotAssertion) -> None:
+def test_replace_body_vue_ts_file(
+    test_case: ReplaceBodyTest, snapshot: SnapshotAssertion, shared_editing_repos: SharedEditingRepos
+) -> None:
     """Test that TypeScript files within Vue projects can be edited."""
-    test_case.run_test(content_after_ground_truth=snapshot)
+    test_case.run_test(content_after_ground_truth=snapshot, shared_repos=shared_editing_repos)
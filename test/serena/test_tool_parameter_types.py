@@ -2,23 +2,33 @@ import logging
 
 import pytest
 
+from serena.agent import SerenaAgent
 from serena.config.serena_config import SerenaConfig
 from serena.mcp import SerenaMCPFactory
 from serena.tools.tools_base import ToolRegistry
 
 
-@pytest.mark.parametrize("context", ("chatgpt", "codex", "oaicompat-agent"))
-def test_all_tool_parameters_have_type(context):
+@pytest.fixture(scope="module")
+def serena_agent() -> SerenaAgent:
     """
-    For every tool exposed by Serena, ensure that the generated
-    Open‑AI schema contains a ``type`` entry for each parameter.
+    Agent with all optional tools included, shared across contexts (since creating the agent is the expensive part).
+    It is created in the default context, which exposes all tools, such that each context's factory is checked for every tool.
     """
     cfg = SerenaConfig(gui_log_window=False, web_dashboard=False, log_level=logging.ERROR)
     registry = ToolRegistry()
     cfg.included_optional_tools = tuple(registry.get_tool_names_optional())
+    return SerenaMCPFactory()._create_serena_agent(cfg)
+
+
+@pytest.mark.parametrize("context", ("chatgpt", "codex", "oaicompat-agent"))
+def test_all_tool_parameters_have_type(context: str, serena_agent: SerenaAgent) -> None:
+    """
+    For every tool exposed by Serena, ensure that the generated
+    Open‑AI schema contains a ``type`` entry for each parameter.
+    """
     factory = SerenaMCPFactory(context=context)
-    # Initialize the agent so that the tools are available
-    factory.agent = factory._create_serena_agent(cfg)
+    # Use the shared agent, such that the tools are available
+    factory.agent = serena_agent
     tools = list(factory._iter_tools())
 
     for tool in tools:
@@ -0,0 +1,73 @@
+from collections.abc import Iterator
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from serena.util.dotnet import DotNETUtil
+
+LIST_RUNTIMES_OUTPUT = (
+    b"Microsoft.AspNetCore.App 10.0.1 [/usr/share/dotnet/shared/Microsoft.AspNetCore.App]\n"
+    b"Microsoft.NETCore.App 8.0.11 [/usr/share/dotnet/shared/Microsoft.NETCore.App]\n"
+    b"Microsoft.NETCore.App 10.0.1 [/usr/share/dotnet/shared/Microsoft.NETCore.App]\n"
+)
+
+
+class TestDotNETUtil:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> Iterator[None]:
+        DotNETUtil.clear_cache()
+        yield
+        DotNETUtil.clear_cache()
+
+    @patch("serena.util.dotnet.subprocess.run")
+    @patch("serena.util.dotnet.shutil.which", return_value="/usr/bin/dotnet")
+    def test_installed_versions_are_parsed(self, mock_which, mock_run):
+        mock_run.return_value = SimpleNamespace(stdout=LIST_RUNTIMES_OUTPUT, stderr=b"", returncode=0)
+
+        assert DotNETUtil("10.0").get_dotnet_path_or_raise() == "/usr/bin/dotnet"
+        assert not DotNETUtil("9.0", allow_higher_version=False).is_required_version_available()
+
+    @patch("serena.util.dotnet.subprocess.run")
+    @patch("serena.util.dotnet.shutil.which", return_value="/usr/bin/dotnet")
+    def test_installed_versions_are_determined_once(self, mock_which, mock_run):
+        mock_run.return_value = SimpleNamespace(stdout=LIST_RUNTIMES_OUTPUT, stderr=b"", returncode=0)
+
+        for version in ["8.0", "10.0", "11.0"]:
+            DotNETUtil(version)
+        assert mock_run.call_count == 1
+
+        # the cached versions expire, such that newly installed runtimes are eventually detected
+        with patch.object(DotNETUtil, "_INSTALLED_VERSIONS_CACHE_TTL", 0.0):
+            DotNETUtil("10.0")
+        assert mock_run.call_count == 2
+
+    @patch("serena.util.dotnet.subprocess.run")
+    @patch("serena.util.dotnet.shutil.which", return_value="/usr/bin/dotnet")
+    def test_cached_versions_are_not_affected_by_mutation(self, mock_which, mock_run):
+        mock_run.return_value = SimpleNamespace(stdout=LIST_RUNTIMES_OUTPUT, stderr=b"", returncode=0)
+
+        DotNETUtil("10.0")._installed_versions.clear()
+        DotNETUtil("10.0")._installed_versions.clear()
+
+        assert DotNETUtil("10.0").is_required_version_available()
+        assert mock_run.call_count == 1
+
+    @patch("serena.util.dotnet.subprocess.run")
+    @patch("serena.util.dotnet.shutil.which", return_value="/usr/bin/dotnet")
+    def test_dotnet_invoked_with_skip_first_run_env(self, mock_which, mock_run):
+        mock_run.return_value = SimpleNamespace(stdout=LIST_RUNTIMES_OUTPUT, stderr=b"", returncode=0)
+
+        DotNETUtil("10.0")
+
+        env = mock_run.call_args.kwargs["env"]
+        assert env["DOTNET_SKIP_FIRST_TIME_EXPERIENCE"] == "1"
+        assert env["DOTNET_CLI_TELEMETRY_OPTOUT"] == "1"
+        assert "PATH" in env, "the environment of the current process must be retained"
+
+    @patch("serena.util.dotnet.subprocess.run", side_effect=OSError("dotnet failed"))
+    @patch("serena.util.dotnet.shutil.which", return_value="/usr/bin/dotnet")
+    def test_failed_detection_is_not_cached(self, mock_which, mock_run):
+        assert not DotNETUtil("10.0").is_required_version_available()
+        assert not DotNETUtil("10.0").is_required_version_available()
+        assert mock_run.call_count == 2
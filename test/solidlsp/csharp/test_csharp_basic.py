@@ -1,5 +1,5 @@
 import os
-import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 from typing import cast
 from unittest.mock import Mock, patch
@@ -17,10 +17,55 @@ from solidlsp.language_servers.csharp_language_server import (
 from solidlsp.ls_config import Language, LanguageServerConfig
 from solidlsp.ls_utils import SymbolUtils
 from solidlsp.settings import SolidLSPSettings
+from test.conftest import get_repo_path, open_files
+
+CSHARP_TEST_REPO_PATH = get_repo_path(Language.CSHARP)
+
+LSP_IDEMPOTENCE_CHECKS = os.getenv("SERENA_TEST_LSP_IDEMPOTENCE") == "1"
+"""
+Flag indicating whether tests shall additionally check that repeated (expensive) requests to the language server return
+the same results; enabled by setting the environment variable SERENA_TEST_LSP_IDEMPOTENCE=1 (e.g. for full/nightly runs)
+"""
+
+
+def _create_empty_files(root: Path, relative_paths: list[str]) -> None:
+    """
+    Creates empty files at the given paths (relative to the root directory), creating each parent directory once.
+    """
+    for parent_dir in {os.path.dirname(relative_path) for relative_path in relative_paths}:
+        if parent_dir:
+            os.makedirs(root / parent_dir, exist_ok=True)
+    for relative_path in relative_paths:
+        os.close(os.open(root / relative_path, os.O_CREAT | os.O_WRONLY))
+
+
+def _create_mock_config() -> Mock:
+    """
+    :return: a mock of the language server configuration without ignored paths
+    """
+    mock_config = Mock(spec=LanguageServerConfig)
+    mock_config.ignored_paths = []
+    return mock_config
+
+
+def _create_mock_settings(ls_resources_dir: str) -> Mock:
+    """
+    :param ls_resources_dir: the directory in which language server resources shall be stored
+    :return: a mock of the SolidLSP settings
+    """
+    mock_settings = Mock(spec=SolidLSPSettings)
+    mock_settings.ls_resources_dir = ls_resources_dir
+    mock_settings.project_data_relative_path = "project_data"
+    return mock_settings
 
 
 @pytest.mark.csharp
 class TestCSharpLanguageServer:
+    @pytest.fixture(scope="class", autouse=True)
+    def open_source_files(self, language_server: SolidLanguageServer) -> Iterator[None]:
+        with open_files(language_server, ["Program.cs", os.path.join("Models", "Person.cs")]):
+            yield
+
     @pytest.mark.parametrize("language_server", [Language.CSHARP], indirect=True)
     def test_find_symbol(self, language_server: SolidLanguageServer) -> None:
         """Test finding symbols in the full symbol tree."""
@@ -93,7 +138,10 @@ class TestCSharpLanguageServer:
 
     @pytest.mark.parametrize("language_server", [Language.CSHARP], indirect=True)
     def test_find_referencing_symbols_across_files(self, language_server: SolidLanguageServer) -> None:
-        """Test finding references to Calculator.Subtract method across files."""
+        """
+        Test finding references to Calculator.Subtract method across files.
+        Whether a repeated request returns the same results is only checked if LSP_IDEMPOTENCE_CHECKS is enabled.
+        """
         # First, find the Subtract method in Program.cs
         file_path = os.path.join("Program.cs")
         symbols = language_server.request_document_symbols(file_path).get_all_symbols_and_roots()
@@ -126,18 +174,16 @@ class TestCSharpLanguageServer:
         ), "Should find reference in Models/Person.cs where Calculator.Subtract is called"
         assert len(refs) > 0, "Should find at least one reference"
 
-        # check for a second time, since the first call may trigger initialization and change the state of the LS
-        refs_second_call = language_server.request_references(file_path, sel_start["line"], sel_start["character"] + 1)
-        assert refs_second_call == refs, "Second call to request_references should return the same results"
+        if LSP_IDEMPOTENCE_CHECKS:
+            # check for a second time, since the first call may trigger initialization and change the state of the LS
+            refs_second_call = language_server.request_references(file_path, sel_start["line"], sel_start["character"] + 1)
+            assert refs_second_call == refs, "Second call to request_references should return the same results"
 
     @pytest.mark.parametrize("language_server", [Language.CSHARP], indirect=True)
     def test_hover_includes_type_information(self, language_server: SolidLanguageServer) -> None:
         """Test that hover information is available and includes type information."""
         file_path = os.path.join("Models", "Person.cs")
 
-        # Open the file first
-        language_server.open_file(file_path)
-
         # Test 1: Hover over the Name property (line 6, column 23 - on "Name")
         # Source: public string Name { get; set; }
         hover_info = language_server.request_hover(file_path, 6, 23)
@@ -179,179 +225,110 @@ class TestCSharpLanguageServer:
 class TestCSharpSolutionProjectOpening:
     """Test C# language server solution and project opening functionality."""
 
-    def test_breadth_first_file_scan(self):
-        """Test that breadth_first_file_scan finds files in breadth-first order."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create test directory structure
-            (temp_path / "file1.txt").touch()
-            (temp_path / "subdir1").mkdir()
-            (temp_path / "subdir1" / "file2.txt").touch()
-            (temp_path / "subdir2").mkdir()
-            (temp_path / "subdir2" / "file3.txt").touch()
-            (temp_path / "subdir1" / "subdir3").mkdir()
-            (temp_path / "subdir1" / "subdir3" / "file4.txt").touch()
-
-            # Scan files
-            files = list(breadth_first_file_scan(str(temp_path)))
-            filenames = [os.path.basename(f) for f in files]
-
-            # Should find all files
-            assert len(files) == 4
-            assert "file1.txt" in filenames
-            assert "file2.txt" in filenames
-            assert "file3.txt" in filenames
-            assert "file4.txt" in filenames
-
-            # file1.txt should be found first (breadth-first)
-            assert filenames[0] == "file1.txt"
-
-    def test_find_solution_or_project_file_with_solution(self):
-        """Test that find_solution_or_project_file prefers .sln files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create both .sln and .csproj files
-            solution_file = temp_path / "MySolution.sln"
-            project_file = temp_path / "MyProject.csproj"
-            solution_file.touch()
-            project_file.touch()
-
-            result = find_solution_or_project_file(str(temp_path))
-
-            # Should prefer .sln file
-            assert result == str(solution_file)
-
-    def test_find_solution_or_project_file_with_project_only(self):
-        """Test that find_solution_or_project_file falls back to .csproj files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create only .csproj file
-            project_file = temp_path / "MyProject.csproj"
-            project_file.touch()
-
-            result = find_solution_or_project_file(str(temp_path))
-
-            # Should return .csproj file
-            assert result == str(project_file)
-
-    def test_find_solution_or_project_file_with_nested_files(self):
-        """Test that find_solution_or_project_file finds files in subdirectories."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create nested structure
-            (temp_path / "src").mkdir()
-            solution_file = temp_path / "src" / "MySolution.sln"
-            solution_file.touch()
-
-            result = find_solution_or_project_file(str(temp_path))
-
-            # Should find nested .sln file
-            assert result == str(solution_file)
-
-    def test_find_solution_or_project_file_returns_none_when_no_files(self):
-        """Test that find_solution_or_project_file returns None when no .sln or .csproj files exist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+    @pytest.fixture
+    def captured_log(self) -> Iterator[logging.MemoryLoggerContext]:
+        """Captures all log messages (including debug messages) emitted during the test, with other loggers suspended."""
+        with SuspendedLoggersContext():
+            logging.getLogger().setLevel(logging.DEBUG)
+            with logging.MemoryLoggerContext() as mem_log:
+                yield mem_log
 
-            # Create some other files
-            (temp_path / "readme.txt").touch()
-            (temp_path / "other.cs").touch()
-
-            result = find_solution_or_project_file(str(temp_path))
-
-            # Should return None
+    @pytest.mark.fs_only
+    def test_breadth_first_file_scan(self, tmp_path: Path):
+        """Test that breadth_first_file_scan finds files in breadth-first order."""
+        # Create test directory structure
+        _create_empty_files(tmp_path, ["file1.txt", "subdir1/file2.txt", "subdir2/file3.txt", "subdir1/subdir3/file4.txt"])
+
+        # Scan files
+        files = list(breadth_first_file_scan(str(tmp_path)))
+        filenames = [os.path.basename(f) for f in files]
+
+        # Should find all files
+        assert len(files) == 4
+        assert "file1.txt" in filenames
+        assert "file2.txt" in filenames
+        assert "file3.txt" in filenames
+        assert "file4.txt" in filenames
+
+        # file1.txt should be found first (breadth-first)
+        assert filenames[0] == "file1.txt"
+
+    @pytest.mark.fs_only
+    @pytest.mark.parametrize(
+        ("file_paths", "expected_file_path"),
+        [
+            # .sln files are preferred over .csproj files
+            pytest.param(["MySolution.sln", "MyProject.csproj"], "MySolution.sln", id="with_solution"),
+            # .csproj files are used if there is no .sln file
+            pytest.param(["MyProject.csproj"], "MyProject.csproj", id="with_project_only"),
+            # files in subdirectories are found
+            pytest.param(["src/MySolution.sln"], "src/MySolution.sln", id="with_nested_files"),
+            # None is returned if there are neither .sln nor .csproj files
+            pytest.param(["readme.txt", "other.cs"], None, id="returns_none_when_no_files"),
+            # .sln files are preferred even when they are deeper in the tree
+            pytest.param(["MyProject.csproj", "src/MySolution.sln"], "src/MySolution.sln", id="prefers_solution_breadth_first"),
+        ],
+    )
+    def test_find_solution_or_project_file(self, file_paths: list[str], expected_file_path: str | None, tmp_path: Path):
+        """Test which solution/project file find_solution_or_project_file selects for different directory structures."""
+        _create_empty_files(tmp_path, file_paths)
+
+        result = find_solution_or_project_file(str(tmp_path))
+
+        if expected_file_path is None:
             assert result is None
-
-    def test_find_solution_or_project_file_prefers_solution_breadth_first(self):
-        """Test that solution files are preferred even when deeper in the tree."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create .csproj at root and .sln in subdirectory
-            project_file = temp_path / "MyProject.csproj"
-            project_file.touch()
-
-            (temp_path / "src").mkdir()
-            solution_file = temp_path / "src" / "MySolution.sln"
-            solution_file.touch()
-
-            result = find_solution_or_project_file(str(temp_path))
-
-            # Should still prefer .sln file even though it's deeper
-            assert result == str(solution_file)
+        else:
+            assert result == str(tmp_path / expected_file_path)
 
     @patch("solidlsp.language_servers.csharp_language_server.CSharpLanguageServer.DependencyProvider._ensure_server_installed")
     @patch("solidlsp.language_servers.csharp_language_server.CSharpLanguageServer._start_server")
-    def test_csharp_language_server_logs_solution_discovery(self, mock_start_server, mock_ensure_server_installed):
+    def test_csharp_language_server_logs_solution_discovery(
+        self, mock_start_server, mock_ensure_server_installed, tmp_path: Path, captured_log: logging.MemoryLoggerContext
+    ):
         """Test that CSharpLanguageServer logs solution/project discovery during initialization."""
         mock_ensure_server_installed.return_value = ("/usr/bin/dotnet", "/path/to/server.dll")
 
         # Create test directory with solution file
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            solution_file = temp_path / "TestSolution.sln"
-            solution_file.touch()
-
-            mock_config = Mock(spec=LanguageServerConfig)
-            mock_config.ignored_paths = []
+        solution_file = tmp_path / "TestSolution.sln"
+        solution_file.touch()
 
-            # Create CSharpLanguageServer instance
-            mock_settings = Mock(spec=SolidLSPSettings)
-            mock_settings.ls_resources_dir = "/tmp/test_ls_resources"
-            mock_settings.project_data_relative_path = "project_data"
+        mock_config = _create_mock_config()
+        mock_settings = _create_mock_settings("/tmp/test_ls_resources")
 
-            with SuspendedLoggersContext():
-                logging.getLogger().setLevel(logging.DEBUG)
-                with logging.MemoryLoggerContext() as mem_log:
-                    CSharpLanguageServer(mock_config, str(temp_path), mock_settings)
+        # Create CSharpLanguageServer instance
+        CSharpLanguageServer(mock_config, str(tmp_path), mock_settings)
 
-                    # Verify that logger was called with solution file discovery
-                    expected_log_msg = f"Found solution/project file: {solution_file}"
-                    assert expected_log_msg in mem_log.get_log()
+        # Verify that logger was called with solution file discovery
+        expected_log_msg = f"Found solution/project file: {solution_file}"
+        assert expected_log_msg in captured_log.get_log()
 
     @patch("solidlsp.language_servers.csharp_language_server.CSharpLanguageServer.DependencyProvider._ensure_server_installed")
     @patch("solidlsp.language_servers.csharp_language_server.CSharpLanguageServer._start_server")
-    def test_csharp_language_server_logs_no_solution_warning(self, mock_start_server, mock_ensure_server_installed):
+    def test_csharp_language_server_logs_no_solution_warning(
+        self, mock_start_server, mock_ensure_server_installed, tmp_path: Path, captured_log: logging.MemoryLoggerContext
+    ):
         """Test that CSharpLanguageServer logs warning when no solution/project files are found."""
         # Mock the server installation
         mock_ensure_server_installed.return_value = ("/usr/bin/dotnet", "/path/to/server.dll")
 
-        # Create empty test directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Mock logger to capture log messages
-            mock_config = Mock(spec=LanguageServerConfig)
-            mock_config.ignored_paths = []
-
-            mock_settings = Mock(spec=SolidLSPSettings)
-            mock_settings.ls_resources_dir = "/tmp/test_ls_resources"
-            mock_settings.project_data_relative_path = "project_data"
+        mock_config = _create_mock_config()
+        mock_settings = _create_mock_settings("/tmp/test_ls_resources")
 
-            # Create CSharpLanguageServer instance
-            with SuspendedLoggersContext():
-                logging.getLogger().setLevel(logging.DEBUG)
-                with logging.MemoryLoggerContext() as mem_log:
-                    CSharpLanguageServer(mock_config, str(temp_path), mock_settings)
+        # Create CSharpLanguageServer instance
+        CSharpLanguageServer(mock_config, str(tmp_path), mock_settings)
 
-                    # Verify that logger was called with warning about no solution/project files
-                    expected_log_msg = "No .sln/.slnx or .csproj file found, language server will attempt auto-discovery"
-                    assert expected_log_msg in mem_log.get_log()
+        # Verify that logger was called with warning about no solution/project files
+        expected_log_msg = "No .sln/.slnx or .csproj file found, language server will attempt auto-discovery"
+        assert expected_log_msg in captured_log.get_log()
 
+    @pytest.mark.fs_only
     def test_solution_and_project_opening_with_real_test_repo(self):
         """Test solution and project opening with the actual C# test repository."""
-        # Get the C# test repo path
-        test_repo_path = Path(__file__).parent.parent.parent / "resources" / "repos" / "csharp" / "test_repo"
-
-        if not test_repo_path.exists():
+        if not CSHARP_TEST_REPO_PATH.is_dir():
             pytest.skip("C# test repository not found")
 
         # Test solution/project discovery in the real test repo
-        result = find_solution_or_project_file(str(test_repo_path))
+        result = find_solution_or_project_file(str(CSHARP_TEST_REPO_PATH))
 
         # Should find either .sln or .csproj file
         assert result is not None
@@ -365,208 +342,174 @@ class TestCSharpSolutionProjectOpening:
 class TestLocalCacheLogic:
     """Tests for the local language server/razor extension caching logic."""
 
-    def test_cache_metadata_save_and_load(self):
+    def test_cache_metadata_save_and_load(self, tmp_path: Path):
         """Test saving and loading cache metadata."""
-        from solidlsp.language_servers.csharp_language_server import CSharpLanguageServer
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            meta_file = temp_path / "test.meta.json"
-            source_path = temp_path / "source"
-            source_path.mkdir()
-
-            # Create a dummy DLL to get a modification time
-            dll_file = source_path / "test.dll"
-            dll_file.touch()
-            source_mtime = dll_file.stat().st_mtime
-
-            # Save metadata
-            CSharpLanguageServer.DependencyProvider._save_local_cache_metadata(meta_file, source_path, source_mtime)
-
-            # Load metadata
-            metadata = CSharpLanguageServer.DependencyProvider._load_local_cache_metadata(meta_file)
-            assert metadata is not None
-            assert metadata["source_path"] == str(source_path)
-            assert metadata["source_mtime"] == source_mtime
-            assert "copied_at" in metadata
-
-    def test_cache_metadata_load_nonexistent(self):
+        meta_file = tmp_path / "test.meta.json"
+        source_path = tmp_path / "source"
+        source_path.mkdir()
+
+        # Create a dummy DLL with a known modification time
+        dll_file = source_path / "test.dll"
+        dll_file.touch()
+        source_mtime = 1_000_000_000.0
+        os.utime(dll_file, (source_mtime, source_mtime))
+
+        # Save metadata
+        CSharpLanguageServer.DependencyProvider._save_local_cache_metadata(meta_file, source_path, source_mtime)
+
+        # Load metadata
+        metadata = CSharpLanguageServer.DependencyProvider._load_local_cache_metadata(meta_file)
+        assert metadata is not None
+        assert metadata["source_path"] == str(source_path)
+        assert metadata["source_mtime"] == source_mtime
+        assert "copied_at" in metadata
+
+    def test_cache_metadata_load_nonexistent(self, tmp_path: Path):
         """Test loading metadata from a nonexistent file returns None."""
-        from solidlsp.language_servers.csharp_language_server import CSharpLanguageServer
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            meta_file = temp_path / "nonexistent.meta.json"
+        meta_file = tmp_path / "nonexistent.meta.json"
 
-            metadata = CSharpLanguageServer.DependencyProvider._load_local_cache_metadata(meta_file)
-            assert metadata is None
+        metadata = CSharpLanguageServer.DependencyProvider._load_local_cache_metadata(meta_file)
+        assert metadata is None
 
-    def test_cache_metadata_load_corrupted(self):
+    def test_cache_metadata_load_corrupted(self, tmp_path: Path):
         """Test loading corrupted metadata returns None."""
-        from solidlsp.language_servers.csharp_language_server import CSharpLanguageServer
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            meta_file = temp_path / "corrupted.meta.json"
+        meta_file = tmp_path / "corrupted.meta.json"
 
-            # Write invalid JSON
-            with open(meta_file, "w") as f:
-                f.write("not valid json {{{")
+        # Write invalid JSON
+        with open(meta_file, "w") as f:
+            f.write("not valid json {{{")
 
-            metadata = CSharpLanguageServer.DependencyProvider._load_local_cache_metadata(meta_file)
-            assert metadata is None
+        metadata = CSharpLanguageServer.DependencyProvider._load_local_cache_metadata(meta_file)
+        assert metadata is None
 
     @patch("solidlsp.language_servers.csharp_language_server.CSharpLanguageServer.DependencyProvider._ensure_dotnet_runtime")
     @patch("solidlsp.language_servers.csharp_language_server.CSharpLanguageServer.DependencyProvider._ensure_language_server")
     @patch("shutil.which")
-    def test_is_local_cache_up_to_date_fresh_cache(self, mock_which, mock_ensure_ls, mock_ensure_dotnet):
+    def test_is_local_cache_up_to_date_fresh_cache(self, mock_which, mock_ensure_ls, mock_ensure_dotnet, tmp_path: Path):
         """Test that cache is considered up-to-date when DLL hasn't changed."""
-        from solidlsp.language_servers.csharp_language_server import CSharpLanguageServer
-        from solidlsp.settings import SolidLSPSettings
-
         mock_which.return_value = "/usr/bin/dotnet"
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create source directory with DLL
-            source_path = temp_path / "source"
-            source_path.mkdir()
-            main_dll = source_path / "Microsoft.CodeAnalysis.LanguageServer.dll"
-            main_dll.touch()
-            source_mtime = main_dll.stat().st_mtime
+        # Create source directory with DLL
+        source_path = tmp_path / "source"
+        source_path.mkdir()
+        main_dll = source_path / "Microsoft.CodeAnalysis.LanguageServer.dll"
+        main_dll.touch()
+        source_mtime = 1_000_000_000.0
+        os.utime(main_dll, (source_mtime, source_mtime))
 
-            # Create cache directory
-            cache_dir = temp_path / "cache"
-            cache_dir.mkdir()
-            (cache_dir / "Microsoft.CodeAnalysis.LanguageServer.dll").touch()
+        # Create cache directory
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "Microsoft.CodeAnalysis.LanguageServer.dll").touch()
 
-            # Create metadata file
-            meta_file = temp_path / "cache.meta.json"
-            CSharpLanguageServer.DependencyProvider._save_local_cache_metadata(meta_file, source_path, source_mtime)
+        # Create metadata file
+        meta_file = tmp_path / "cache.meta.json"
+        CSharpLanguageServer.DependencyProvider._save_local_cache_metadata(meta_file, source_path, source_mtime)
 
-            # Create DependencyProvider instance
-            mock_settings = Mock(spec=SolidLSPSettings)
-            mock_settings.ls_resources_dir = str(temp_path)
-            mock_settings.project_data_relative_path = "project_data"
+        # Create DependencyProvider instance
+        mock_settings = _create_mock_settings(str(tmp_path))
 
-            custom_settings = {"local_language_server_path": str(source_path)}
+        custom_settings = {"local_language_server_path": str(source_path)}
 
-            provider = CSharpLanguageServer.DependencyProvider(
-                custom_settings=cast(SolidLSPSettings.CustomLSSettings, custom_settings),
-                ls_resources_dir=str(temp_path / "resources"),
-                solidlsp_settings=mock_settings,
-                repository_root_path=str(temp_path),
-            )
+        provider = CSharpLanguageServer.DependencyProvider(
+            custom_settings=cast(SolidLSPSettings.CustomLSSettings, custom_settings),
+            ls_resources_dir=str(tmp_path / "resources"),
+            solidlsp_settings=mock_settings,
+            repository_root_path=str(tmp_path),
+        )
 
-            # Test that cache is up-to-date
-            result = provider._is_local_cache_up_to_date(source_path, cache_dir, meta_file, "Microsoft.CodeAnalysis.LanguageServer.dll")
-            assert result is True
+        # Test that cache is up-to-date
+        result = provider._is_local_cache_up_to_date(source_path, cache_dir, meta_file, "Microsoft.CodeAnalysis.LanguageServer.dll")
+        assert result is True
 
     @patch("solidlsp.language_servers.csharp_language_server.CSharpLanguageServer.DependencyProvider._ensure_dotnet_runtime")
     @patch("solidlsp.language_servers.csharp_language_server.CSharpLanguageServer.DependencyProvider._ensure_language_server")
     @patch("shutil.which")
-    def test_is_local_cache_up_to_date_stale_cache(self, mock_which, mock_ensure_ls, mock_ensure_dotnet):
+    def test_is_local_cache_up_to_date_stale_cache(self, mock_which, mock_ensure_ls, mock_ensure_dotnet, tmp_path: Path):
         """Test that cache is considered stale when DLL modification time changes."""
-        import time
-
-        from solidlsp.language_servers.csharp_language_server import CSharpLanguageServer
-        from solidlsp.settings import SolidLSPSettings
-
         mock_which.return_value = "/usr/bin/dotnet"
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        # Create source directory with DLL
+        source_path = tmp_path / "source"
+        source_path.mkdir()
+        main_dll = source_path / "Microsoft.CodeAnalysis.LanguageServer.dll"
+        main_dll.touch()
+        old_mtime = 1_000_000_000.0
+        os.utime(main_dll, (old_mtime, old_mtime))
 
-            # Create source directory with DLL
-            source_path = temp_path / "source"
-            source_path.mkdir()
-            main_dll = source_path / "Microsoft.CodeAnalysis.LanguageServer.dll"
-            main_dll.touch()
-            old_mtime = main_dll.stat().st_mtime
+        # Create cache directory
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "Microsoft.CodeAnalysis.LanguageServer.dll").touch()
 
-            # Create cache directory
-            cache_dir = temp_path / "cache"
-            cache_dir.mkdir()
-            (cache_dir / "Microsoft.CodeAnalysis.LanguageServer.dll").touch()
+        # Create metadata file with old mtime
+        meta_file = tmp_path / "cache.meta.json"
+        CSharpLanguageServer.DependencyProvider._save_local_cache_metadata(meta_file, source_path, old_mtime)
 
-            # Create metadata file with old mtime
-            meta_file = temp_path / "cache.meta.json"
-            CSharpLanguageServer.DependencyProvider._save_local_cache_metadata(meta_file, source_path, old_mtime)
+        # Simulate DLL rebuild by modifying it (with a modification time that is guaranteed to differ)
+        main_dll.write_text("updated content")
+        new_mtime = 2_000_000_000.0
+        os.utime(main_dll, (new_mtime, new_mtime))
 
-            # Simulate DLL rebuild by modifying it
-            time.sleep(0.01)  # Ensure time difference
-            main_dll.write_text("updated content")
+        # Create DependencyProvider instance
+        mock_settings = _create_mock_settings(str(tmp_path))
 
-            # Create DependencyProvider instance
-            mock_settings = Mock(spec=SolidLSPSettings)
-            mock_settings.ls_resources_dir = str(temp_path)
-            mock_settings.project_data_relative_path = "project_data"
+        custom_settings = {"local_language_server_path": str(source_path)}
 
-            custom_settings = {"local_language_server_path": str(source_path)}
+        provider = CSharpLanguageServer.DependencyProvider(
+            custom_settings=cast(SolidLSPSettings.CustomLSSettings, custom_settings),
+            ls_resources_dir=str(tmp_path / "resources"),
+            solidlsp_settings=mock_settings,
+            repository_root_path=str(tmp_path),
+        )
 
-            provider = CSharpLanguageServer.DependencyProvider(
-                custom_settings=cast(SolidLSPSettings.CustomLSSettings, custom_settings),
-                ls_resources_dir=str(temp_path / "resources"),
-                solidlsp_settings=mock_settings,
-                repository_root_path=str(temp_path),
-            )
-
-            # Test that cache is stale
-            result = provider._is_local_cache_up_to_date(source_path, cache_dir, meta_file, "Microsoft.CodeAnalysis.LanguageServer.dll")
-            assert result is False
+        # Test that cache is stale
+        result = provider._is_local_cache_up_to_date(source_path, cache_dir, meta_file, "Microsoft.CodeAnalysis.LanguageServer.dll")
+        assert result is False
 
     @patch("solidlsp.language_servers.csharp_language_server.CSharpLanguageServer.DependencyProvider._ensure_dotnet_runtime")
     @patch("solidlsp.language_servers.csharp_language_server.CSharpLanguageServer.DependencyProvider._ensure_language_server")
     @patch("shutil.which")
-    def test_copy_local_to_cache(self, mock_which, mock_ensure_ls, mock_ensure_dotnet):
+    def test_copy_local_to_cache(self, mock_which, mock_ensure_ls, mock_ensure_dotnet, tmp_path: Path):
         """Test copying local directory to cache."""
-        from solidlsp.language_servers.csharp_language_server import CSharpLanguageServer
-        from solidlsp.settings import SolidLSPSettings
-
         mock_which.return_value = "/usr/bin/dotnet"
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create source directory with files
-            source_path = temp_path / "source"
-            source_path.mkdir()
-            main_dll = source_path / "Microsoft.CodeAnalysis.LanguageServer.dll"
-            main_dll.write_text("dll content")
-            (source_path / "other.dll").write_text("other content")
-            (source_path / "subdir").mkdir()
-            (source_path / "subdir" / "nested.dll").write_text("nested content")
-
-            cache_dir = temp_path / "cache"
-            meta_file = temp_path / "cache.meta.json"
-
-            # Create DependencyProvider instance
-            mock_settings = Mock(spec=SolidLSPSettings)
-            mock_settings.ls_resources_dir = str(temp_path)
-            mock_settings.project_data_relative_path = "project_data"
-
-            custom_settings = {"local_language_server_path": str(source_path)}
-
-            provider = CSharpLanguageServer.DependencyProvider(
-                custom_settings=cast(SolidLSPSettings.CustomLSSettings, custom_settings),
-                ls_resources_dir=str(temp_path / "resources"),
-                solidlsp_settings=mock_settings,
-                repository_root_path=str(temp_path),
-            )
-
-            # Copy to cache
-            result = provider._copy_local_to_cache(source_path, cache_dir, meta_file, "Microsoft.CodeAnalysis.LanguageServer.dll")
-
-            assert result is not None
-            assert result == cache_dir
-            assert cache_dir.exists()
-            assert (cache_dir / "Microsoft.CodeAnalysis.LanguageServer.dll").exists()
-            assert (cache_dir / "other.dll").exists()
-            assert (cache_dir / "subdir" / "nested.dll").exists()
-            assert meta_file.exists()
-
-            # Verify metadata content
-            metadata = CSharpLanguageServer.DependencyProvider._load_local_cache_metadata(meta_file)
-            assert metadata is not None
-            assert metadata["source_path"] == str(source_path)
+        # Create source directory with files
+        source_path = tmp_path / "source"
+        source_path.mkdir()
+        main_dll = source_path / "Microsoft.CodeAnalysis.LanguageServer.dll"
+        main_dll.write_text("dll content")
+        (source_path / "other.dll").write_text("other content")
+        (source_path / "subdir").mkdir()
+        (source_path / "subdir" / "nested.dll").write_text("nested content")
+
+        cache_dir = tmp_path / "cache"
+        meta_file = tmp_path / "cache.meta.json"
+
+        # Create DependencyProvider instance
+        mock_settings = _create_mock_settings(str(tmp_path))
+
+        custom_settings = {"local_language_server_path": str(source_path)}
+
+        provider = CSharpLanguageServer.DependencyProvider(
+            custom_settings=cast(SolidLSPSettings.CustomLSSettings, custom_settings),
+            ls_resources_dir=str(tmp_path / "resources"),
+            solidlsp_settings=mock_settings,
+            repository_root_path=str(tmp_path),
+        )
+
+        # Copy to cache
+        result = provider._copy_local_to_cache(source_path, cache_dir, meta_file, "Microsoft.CodeAnalysis.LanguageServer.dll")
+
+        assert result is not None
+        assert result == cache_dir
+        assert cache_dir.exists()
+        assert (cache_dir / "Microsoft.CodeAnalysis.LanguageServer.dll").exists()
+        assert (cache_dir / "other.dll").exists()
+        assert (cache_dir / "subdir" / "nested.dll").exists()
+        assert meta_file.exists()
+
+        # Verify metadata content
+        metadata = CSharpLanguageServer.DependencyProvider._load_local_cache_metadata(meta_file)
+        assert metadata is not None
+        assert metadata["source_path"] == str(source_path)
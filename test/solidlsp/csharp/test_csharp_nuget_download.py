@@ -1,12 +1,13 @@
 """Tests for C# language server NuGet package download from NuGet.org."""
 
-import tempfile
+import zipfile
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from solidlsp.language_servers.common import RuntimeDependency
-from solidlsp.language_servers.csharp_language_server import CSharpLanguageServer
+from solidlsp.language_servers.csharp_language_server import _RUNTIME_DEPENDENCIES, CSharpLanguageServer
 from solidlsp.settings import SolidLSPSettings
 
 
@@ -14,53 +15,51 @@ from solidlsp.settings import SolidLSPSettings
 class TestNuGetOrgDownload:
     """Test downloading Roslyn language server packages from NuGet.org."""
 
-    def test_download_nuget_package_uses_direct_url(self):
+    @pytest.fixture
+    def dependency_provider(self, tmp_path: Path) -> CSharpLanguageServer.DependencyProvider:
+        """Dependency provider with default settings, using a fresh language server resources directory."""
+        return CSharpLanguageServer.DependencyProvider(
+            custom_settings=SolidLSPSettings.CustomLSSettings({}),
+            ls_resources_dir=str(tmp_path),
+            solidlsp_settings=SolidLSPSettings(),
+            repository_root_path="/fake/repo",
+        )
+
+    def test_download_nuget_package_uses_direct_url(self, dependency_provider: CSharpLanguageServer.DependencyProvider):
         """Test that _download_nuget_package uses the URL from RuntimeDependency directly."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create a RuntimeDependency with a NuGet.org URL
-            test_dependency = RuntimeDependency(
-                id="TestPackage",
-                description="Test package from NuGet.org",
-                package_name="roslyn-language-server.linux-x64",
-                package_version="5.5.0-2.26078.4",
-                url="https://www.nuget.org/api/v2/package/roslyn-language-server.linux-x64/5.5.0-2.26078.4",
-                platform_id="linux-x64",
-                archive_type="nupkg",
-                binary_name="Microsoft.CodeAnalysis.LanguageServer.dll",
-                extract_path="content/LanguageServer/linux-x64",
-            )
-
-            # Mock the dependency provider
-            mock_settings = SolidLSPSettings()
-            custom_settings = SolidLSPSettings.CustomLSSettings({})
-
-            dependency_provider = CSharpLanguageServer.DependencyProvider(
-                custom_settings=custom_settings,
-                ls_resources_dir=temp_dir,
-                solidlsp_settings=mock_settings,
-                repository_root_path="/fake/repo",
-            )
-
-            # Mock urllib.request.urlretrieve to capture the URL being used
-            with patch("solidlsp.language_servers.csharp_language_server.urllib.request.urlretrieve") as mock_retrieve:
-                with patch("solidlsp.language_servers.csharp_language_server.SafeZipExtractor"):
-                    try:
-                        dependency_provider._download_nuget_package(test_dependency)
-                    except Exception:
-                        # Expected to fail since we're mocking, but we want to check the URL
-                        pass
-
-                    # Verify that urlretrieve was called with the NuGet.org URL
-                    assert mock_retrieve.called, "urlretrieve should be called"
-                    called_url = mock_retrieve.call_args[0][0]
-                    assert called_url == test_dependency.url, f"Should use URL from RuntimeDependency: {test_dependency.url}"
-                    assert "nuget.org" in called_url, "Should use NuGet.org URL"
-                    assert "azure" not in called_url.lower(), "Should not use Azure feed"
+        # Create a RuntimeDependency with a NuGet.org URL
+        test_dependency = RuntimeDependency(
+            id="TestPackage",
+            description="Test package from NuGet.org",
+            package_name="roslyn-language-server.linux-x64",
+            package_version="5.5.0-2.26078.4",
+            url="https://www.nuget.org/api/v2/package/roslyn-language-server.linux-x64/5.5.0-2.26078.4",
+            platform_id="linux-x64",
+            archive_type="nupkg",
+            binary_name="Microsoft.CodeAnalysis.LanguageServer.dll",
+            extract_path="content/LanguageServer/linux-x64",
+        )
+
+        # Mock urllib.request.urlretrieve to capture the URL being used
+        with (
+            patch("solidlsp.language_servers.csharp_language_server.urllib.request.urlretrieve") as mock_retrieve,
+            patch("solidlsp.language_servers.csharp_language_server.SafeZipExtractor"),
+        ):
+            try:
+                dependency_provider._download_nuget_package(test_dependency)
+            except Exception:
+                # Expected to fail since we're mocking, but we want to check the URL
+                pass
+
+        # Verify that urlretrieve was called with the NuGet.org URL
+        assert mock_retrieve.called, "urlretrieve should be called"
+        called_url = mock_retrieve.call_args[0][0]
+        assert called_url == test_dependency.url, f"Should use URL from RuntimeDependency: {test_dependency.url}"
+        assert "nuget.org" in called_url, "Should use NuGet.org URL"
+        assert "azure" not in called_url.lower(), "Should not use Azure feed"
 
     def test_runtime_dependencies_use_nuget_org_urls(self):
         """Test that _RUNTIME_DEPENDENCIES are configured with NuGet.org URLs."""
-        from solidlsp.language_servers.csharp_language_server import _RUNTIME_DEPENDENCIES
-
         # Check language server dependencies
         lang_server_deps = [dep for dep in _RUNTIME_DEPENDENCIES if dep.id == "CSharpLanguageServer"]
 
@@ -81,38 +80,74 @@ class TestNuGetOrgDownload:
             assert "nuget.org" in dep.url, f"URL should point to nuget.org, got: {dep.url}"
             assert "azure" not in dep.url.lower(), f"URL should not point to Azure feed, got: {dep.url}"
 
-    def test_download_method_does_not_call_azure_feed(self):
+    def test_download_method_does_not_call_azure_feed(self, dependency_provider: CSharpLanguageServer.DependencyProvider):
         """Test that the new download method does not attempt to access Azure feed."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            test_dependency = RuntimeDependency(
-                id="TestPackage",
-                description="Test package",
-                package_name="roslyn-language-server.linux-x64",
-                package_version="5.5.0-2.26078.4",
-                url="https://www.nuget.org/api/v2/package/roslyn-language-server.linux-x64/5.5.0-2.26078.4",
-                platform_id="linux-x64",
-                archive_type="nupkg",
-                binary_name="test.dll",
+        test_dependency = RuntimeDependency(
+            id="TestPackage",
+            description="Test package",
+            package_name="roslyn-language-server.linux-x64",
+            package_version="5.5.0-2.26078.4",
+            url="https://www.nuget.org/api/v2/package/roslyn-language-server.linux-x64/5.5.0-2.26078.4",
+            platform_id="linux-x64",
+            archive_type="nupkg",
+            binary_name="test.dll",
+        )
+
+        # Mock urllib.request.urlopen to track if Azure feed is accessed
+        with (
+            patch("solidlsp.language_servers.csharp_language_server.urllib.request.urlopen") as mock_urlopen,
+            patch("solidlsp.language_servers.csharp_language_server.urllib.request.urlretrieve"),
+            patch("solidlsp.language_servers.csharp_language_server.SafeZipExtractor"),
+        ):
+            try:
+                dependency_provider._download_nuget_package(test_dependency)
+            except Exception:
+                pass
+
+        # Verify that urlopen was NOT called (no service index lookup)
+        assert not mock_urlopen.called, "Should not call urlopen for Azure service index lookup"
+
+    def test_installed_language_server_is_not_downloaded_again(self, tmp_path: Path):
+        """Test that no package is downloaded if the language server DLL is already present in the resources directory."""
+        with patch.object(CSharpLanguageServer.DependencyProvider, "_ensure_server_installed", return_value=("dotnet", "server.dll")):
+            dependency_provider = CSharpLanguageServer.DependencyProvider(
+                custom_settings=SolidLSPSettings.CustomLSSettings({"enable_razor": False}),
+                ls_resources_dir=str(tmp_path),
+                solidlsp_settings=SolidLSPSettings(),
+                repository_root_path="/fake/repo",
             )
 
-            mock_settings = SolidLSPSettings()
-            custom_settings = SolidLSPSettings.CustomLSSettings({})
+        lang_server_dep = next(dep for dep in _RUNTIME_DEPENDENCIES if dep.id == "CSharpLanguageServer")
+        assert lang_server_dep.binary_name is not None
+        server_dll = tmp_path / f"{lang_server_dep.package_name}.{lang_server_dep.package_version}" / lang_server_dep.binary_name
+        server_dll.parent.mkdir(parents=True)
+        server_dll.touch()
+
+        with patch("solidlsp.language_servers.csharp_language_server.urllib.request.urlretrieve") as mock_retrieve:
+            result = dependency_provider._ensure_language_server(lang_server_dep)
 
+        assert result == str(server_dll)
+        assert not mock_retrieve.called, "urlretrieve should not be called for an already installed language server"
+
+    def test_only_language_server_files_are_extracted(self, tmp_path: Path):
+        """Test that only the package directories which may contain the language server are extracted from the package."""
+        with patch.object(CSharpLanguageServer.DependencyProvider, "_ensure_server_installed", return_value=("dotnet", "server.dll")):
             dependency_provider = CSharpLanguageServer.DependencyProvider(
-                custom_settings=custom_settings,
-                ls_resources_dir=temp_dir,
-                solidlsp_settings=mock_settings,
+                custom_settings=SolidLSPSettings.CustomLSSettings({"enable_razor": False}),
+                ls_resources_dir=str(tmp_path),
+                solidlsp_settings=SolidLSPSettings(),
                 repository_root_path="/fake/repo",
             )
+        lang_server_dep = next(dep for dep in _RUNTIME_DEPENDENCIES if dep.platform_id == "linux-x64")
+
+        def write_nupkg(url: str, path: Path) -> None:
+            with zipfile.ZipFile(path, "w") as nupkg:
+                nupkg.writestr(f"{lang_server_dep.extract_path}/Microsoft.CodeAnalysis.LanguageServer.dll", "dll")
+                nupkg.writestr("roslyn-language-server.linux-x64.nuspec", "nuspec")
+                nupkg.writestr("tools/net8.0/linux-x64/Other.dll", "other")
+
+        with patch("solidlsp.language_servers.csharp_language_server.urllib.request.urlretrieve", side_effect=write_nupkg):
+            package_dir = dependency_provider._download_nuget_package(lang_server_dep)
 
-            # Mock urllib.request.urlopen to track if Azure feed is accessed
-            with patch("solidlsp.language_servers.csharp_language_server.urllib.request.urlopen") as mock_urlopen:
-                with patch("solidlsp.language_servers.csharp_language_server.urllib.request.urlretrieve"):
-                    with patch("solidlsp.language_servers.csharp_language_server.SafeZipExtractor"):
-                        try:
-                            dependency_provider._download_nuget_package(test_dependency)
-                        except Exception:
-                            pass
-
-                        # Verify that urlopen was NOT called (no service index lookup)
-                        assert not mock_urlopen.called, "Should not call urlopen for Azure service index lookup"
+        extracted_files = sorted(p.relative_to(package_dir).as_posix() for p in package_dir.rglob("*") if p.is_file())
+        assert extracted_files == [f"{lang_server_dep.extract_path}/Microsoft.CodeAnalysis.LanguageServer.dll"]
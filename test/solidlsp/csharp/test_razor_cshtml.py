@@ -11,6 +11,8 @@ Or run specific test:
 import logging
 import os
 import time
+import weakref
+from typing import Any
 
 import pytest
 
@@ -19,8 +21,52 @@ from solidlsp.ls_config import Language
 
 log = logging.getLogger(__name__)
 
+RAZOR_PROBE_FILE = os.path.join("Components", "Counter.razor")
+"""
+a .razor file for which the Razor extension is known to return symbols once it has been initialized
+"""
+
+_razor_ready: weakref.WeakKeyDictionary[SolidLanguageServer, bool] = weakref.WeakKeyDictionary()
+
+
+def _flatten_symbol_names(symbols: list[Any]) -> list[str | None]:
+    """
+    :param symbols: a list of symbol dictionaries and/or lists of symbol dictionaries
+    :return: the names of all contained symbols
+    """
+    return [item.get("name") for s in symbols for item in (s if isinstance(s, list) else [s]) if isinstance(item, dict)]
+
+
+def _wait_for_razor_ready(ls: SolidLanguageServer, timeout: float = 5.0, interval: float = 0.05) -> None:
+    """
+    Waits until the Razor extension of the given language server is initialized, i.e. until it returns
+    symbols for a known-good .razor file. Readiness is remembered per language server instance, such that
+    subsequent tests using the same instance do not probe again.
+
+    :param ls: the C# language server
+    :param timeout: the maximum number of seconds to wait; if the extension is not ready by then, the test fails
+    :param interval: the number of seconds to wait between two probes
+    """
+    if _razor_ready.get(ls):
+        return
+    deadline = time.monotonic() + timeout
+    with ls.open_file(RAZOR_PROBE_FILE) as file_buffer:
+        while True:
+            try:
+                # the request is sent to the server directly rather than via request_document_symbols, such that the
+                # empty results returned before the extension is initialized do not end up in the document symbols cache
+                if ls.server.send.document_symbol({"textDocument": {"uri": file_buffer.uri}}):
+                    _razor_ready[ls] = True
+                    return
+            except Exception as e:
+                log.debug(f"Razor extension not ready yet: {e}")
+            if time.monotonic() >= deadline:
+                pytest.fail(f"Razor extension did not return symbols for {RAZOR_PROBE_FILE} within {timeout}s")
+            time.sleep(interval)
+
 
 @pytest.mark.csharp
+@pytest.mark.slow
 class TestRazorCshtmlParsing:
     """Test Razor and CSHTML file parsing."""
 
@@ -30,8 +76,7 @@ class TestRazorCshtmlParsing:
         file_path = os.path.join("Components", "Counter.razor")
         log.info(f"Testing .razor file: {file_path}")
 
-        # Wait for Razor extension to initialize
-        time.sleep(2)
+        _wait_for_razor_ready(language_server)
 
         symbols = language_server.request_document_symbols(file_path)
         all_symbols = symbols.get_all_symbols_and_roots()
@@ -43,12 +88,7 @@ class TestRazorCshtmlParsing:
         assert len(all_symbols) > 0, "No symbols returned for .razor file"
 
         # Look for expected symbols from Counter.razor
-        symbol_names = []
-        for s in all_symbols:
-            if isinstance(s, list):
-                symbol_names.extend([item.get("name") for item in s if isinstance(item, dict)])
-            elif isinstance(s, dict):
-                symbol_names.append(s.get("name"))
+        symbol_names = _flatten_symbol_names(all_symbols)
 
         log.info(f"Symbol names found: {symbol_names}")
         assert (
@@ -61,8 +101,7 @@ class TestRazorCshtmlParsing:
         file_path = os.path.join("Views", "WithCode.cshtml")
         log.info(f"Testing .cshtml file: {file_path}")
 
-        # Wait for Razor extension to initialize
-        time.sleep(2)
+        _wait_for_razor_ready(language_server)
 
         symbols = language_server.request_document_symbols(file_path)
         all_symbols = symbols.get_all_symbols_and_roots()
@@ -74,12 +113,7 @@ class TestRazorCshtmlParsing:
         assert len(all_symbols) > 0, "No symbols returned for .cshtml file"
 
         # Look for expected symbols from WithCode.cshtml
-        symbol_names = []
-        for s in all_symbols:
-            if isinstance(s, list):
-                symbol_names.extend([item.get("name") for item in s if isinstance(item, dict)])
-            elif isinstance(s, dict):
-                symbol_names.append(s.get("name"))
+        symbol_names = _flatten_symbol_names(all_symbols)
 
         log.info(f"Symbol names found: {symbol_names}")
         # WithCode.cshtml has: Message, Counter, IncrementCounter, GetGreeting
@@ -93,8 +127,7 @@ class TestRazorCshtmlParsing:
         file_path = os.path.join("Views", "Index.cshtml")
         log.info(f"Testing simple .cshtml file: {file_path}")
 
-        # Wait for Razor extension to initialize
-        time.sleep(2)
+        _wait_for_razor_ready(language_server)
 
         symbols = language_server.request_document_symbols(file_path)
         all_symbols = symbols.get_all_symbols_and_roots()
@@ -108,8 +141,7 @@ class TestRazorCshtmlParsing:
     @pytest.mark.parametrize("language_server", [Language.CSHARP], indirect=True)
     def test_compare_razor_vs_cshtml(self, language_server: SolidLanguageServer) -> None:
         """Compare symbol retrieval between .razor and .cshtml files."""
-        # Wait for Razor extension to initialize
-        time.sleep(3)
+        _wait_for_razor_ready(language_server)
 
         # Test .razor file
         razor_path = os.path.join("Components", "Counter.razor")
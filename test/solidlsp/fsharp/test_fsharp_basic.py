@@ -7,29 +7,29 @@ import pytest
 from solidlsp import SolidLanguageServer
 from solidlsp.ls_config import Language
 from solidlsp.ls_utils import SymbolUtils
-from test.conftest import is_ci
+from test.conftest import index_references_by_file_name, is_ci
+
+PROGRAM_FS = "Program.fs"
+CALCULATOR_FS = "Calculator.fs"
+PERSON_FS = os.path.join("Models", "Person.fs")
 
 
 @pytest.mark.fsharp
+@pytest.mark.xdist_group("fsharp")
 class TestFSharpLanguageServer:
     @pytest.mark.parametrize("language_server", [Language.FSHARP], indirect=True)
     def test_find_symbol(self, language_server: SolidLanguageServer) -> None:
         """Test finding symbols in the full symbol tree."""
         symbols = language_server.request_full_symbol_tree()
 
-        # Check for main program module symbols
-        assert SymbolUtils.symbol_tree_contains_name(symbols, "Program"), "Program module not found in symbol tree"
-        assert SymbolUtils.symbol_tree_contains_name(symbols, "main"), "main function not found in symbol tree"
-
-        # Check for Calculator module symbols
-        assert SymbolUtils.symbol_tree_contains_name(symbols, "Calculator"), "Calculator module not found in symbol tree"
-        assert SymbolUtils.symbol_tree_contains_name(symbols, "add"), "add function not found in symbol tree"
-        assert SymbolUtils.symbol_tree_contains_name(symbols, "CalculatorClass"), "CalculatorClass not found in symbol tree"
+        # Check for main program module symbols and Calculator module symbols
+        missing_names = SymbolUtils.symbol_tree_contains_all(symbols, {"Program", "main", "Calculator", "add", "CalculatorClass"})
+        assert not missing_names, f"Symbols {missing_names} not found in symbol tree"
 
     @pytest.mark.parametrize("language_server", [Language.FSHARP], indirect=True)
     def test_get_document_symbols_program(self, language_server: SolidLanguageServer) -> None:
         """Test getting document symbols from the main Program.fs file."""
-        file_path = os.path.join("Program.fs")
+        file_path = PROGRAM_FS
         symbols = language_server.request_document_symbols(file_path).get_all_symbols_and_roots()[0]
 
         # Look for expected functions and modules
@@ -39,30 +39,25 @@ class TestFSharpLanguageServer:
     @pytest.mark.parametrize("language_server", [Language.FSHARP], indirect=True)
     def test_get_document_symbols_calculator(self, language_server: SolidLanguageServer) -> None:
         """Test getting document symbols from Calculator.fs file."""
-        file_path = os.path.join("Calculator.fs")
+        file_path = CALCULATOR_FS
         symbols = language_server.request_document_symbols(file_path).get_all_symbols_and_roots()[0]
 
         # Look for expected functions
-        symbol_names = [s.get("name") for s in symbols]
-        expected_symbols = ["add", "subtract", "multiply", "divide", "square", "factorial", "CalculatorClass"]
+        symbol_names = {s.get("name") for s in symbols}
+        expected_symbols = {"add", "subtract", "multiply", "divide", "square", "factorial", "CalculatorClass"}
 
-        for expected in expected_symbols:
-            assert expected in symbol_names, f"{expected} function not found in Calculator.fs symbols"
+        missing_symbols = expected_symbols - symbol_names
+        assert not missing_symbols, f"Functions {missing_symbols} not found in Calculator.fs symbols"
 
     @pytest.mark.xfail(is_ci, reason="Test is flaky")  # TODO: Re-enable if the LS can be made more reliable #1040
     @pytest.mark.parametrize("language_server", [Language.FSHARP], indirect=True)
     def test_find_referencing_symbols(self, language_server: SolidLanguageServer) -> None:
         """Test finding references using symbol selection range."""
-        file_path = os.path.join("Calculator.fs")
+        file_path = CALCULATOR_FS
         symbols = language_server.request_document_symbols(file_path)
 
         # Find the 'add' function symbol
-        add_symbol = None
-
-        for sym in symbols.iter_symbols():
-            if sym.get("name") == "add":
-                add_symbol = sym
-                break
+        add_symbol = next((sym for sym in symbols.iter_symbols() if sym.get("name") == "add"), None)
 
         assert add_symbol is not None, "Could not find 'add' function symbol in Calculator.fs"
 
@@ -71,34 +66,30 @@ class TestFSharpLanguageServer:
         refs = language_server.request_references(file_path, sel_start["line"], sel_start["character"] + 1)
 
         # The add function should be referenced in Program.fs
-        assert any("Program.fs" in ref.get("relativePath", "") for ref in refs), "Program.fs should reference add function"
+        assert "Program.fs" in index_references_by_file_name(refs), "Program.fs should reference add function"
 
     @pytest.mark.parametrize("language_server", [Language.FSHARP], indirect=True)
     def test_nested_module_symbols(self, language_server: SolidLanguageServer) -> None:
         """Test getting symbols from nested Models namespace."""
-        file_path = os.path.join("Models", "Person.fs")
+        file_path = PERSON_FS
         symbols = language_server.request_document_symbols(file_path).get_all_symbols_and_roots()[0]
 
         # Check for expected types and modules
-        symbol_names = [s.get("name") for s in symbols]
-        expected_symbols = ["Person", "PersonModule", "Address", "Employee"]
+        symbol_names = {s.get("name") for s in symbols}
+        expected_symbols = {"Person", "PersonModule", "Address", "Employee"}
 
-        for expected in expected_symbols:
-            assert expected in symbol_names, f"{expected} not found in Person.fs symbols"
+        missing_symbols = expected_symbols - symbol_names
+        assert not missing_symbols, f"Symbols {missing_symbols} not found in Person.fs symbols"
 
     @pytest.mark.xfail(is_ci, reason="Test is flaky")  # TODO: Re-enable if the LS can be made more reliable #1040
     @pytest.mark.parametrize("language_server", [Language.FSHARP], indirect=True)
     def test_find_referencing_symbols_across_files(self, language_server: SolidLanguageServer) -> None:
         """Test finding references to Calculator functions across files."""
         # Find the subtract function in Calculator.fs
-        file_path = os.path.join("Calculator.fs")
+        file_path = CALCULATOR_FS
         symbols = language_server.request_document_symbols(file_path)
 
-        subtract_symbol = None
-        for sym in symbols.iter_symbols():
-            if sym.get("name") == "subtract":
-                subtract_symbol = sym
-                break
+        subtract_symbol = next((sym for sym in symbols.iter_symbols() if sym.get("name") == "subtract"), None)
 
         assert subtract_symbol is not None, "Could not find 'subtract' function symbol"
 
@@ -107,13 +98,13 @@ class TestFSharpLanguageServer:
         refs = language_server.request_references(file_path, sel_start["line"], sel_start["character"] + 1)
 
         # The subtract function should be referenced in Program.fs
-        assert any("Program.fs" in ref.get("relativePath", "") for ref in refs), "Program.fs should reference subtract function"
+        assert "Program.fs" in index_references_by_file_name(refs), "Program.fs should reference subtract function"
 
     @pytest.mark.parametrize("language_server", [Language.FSHARP], indirect=True)
     def test_go_to_definition(self, language_server: SolidLanguageServer) -> None:
         """Test go-to-definition functionality."""
         # Test going to definition of 'add' function from Program.fs
-        program_file = os.path.join("Program.fs")
+        program_file = PROGRAM_FS
 
         # Try to find definition of 'add' function used in Program.fs
         # This would typically be at the line where 'add 5 3' is called
@@ -126,7 +117,7 @@ class TestFSharpLanguageServer:
     @pytest.mark.parametrize("language_server", [Language.FSHARP], indirect=True)
     def test_hover_information(self, language_server: SolidLanguageServer) -> None:
         """Test hover information functionality."""
-        file_path = os.path.join("Calculator.fs")
+        file_path = CALCULATOR_FS
 
         # Try to get hover information for a function
         hover_info = language_server.request_hover(file_path, 5, 10)  # Approximate position of a function
@@ -138,13 +129,14 @@ class TestFSharpLanguageServer:
     @pytest.mark.parametrize("language_server", [Language.FSHARP], indirect=True)
     def test_completion(self, language_server: SolidLanguageServer) -> None:
         """Test code completion functionality."""
-        file_path = os.path.join("Program.fs")
+        file_path = PROGRAM_FS
 
-        # Use threading for cross-platform timeout (signal.SIGALRM is Unix-only)
+        # Use a daemon thread for a cross-platform timeout (signal.SIGALRM is Unix-only); if the request hangs,
+        # the thread is abandoned without preventing the interpreter from exiting
         result: dict[str, Any] = dict(value=None)
         exception: dict[str, Any] = dict(value=None)
 
-        def run_completion():
+        def run_completion() -> None:
             try:
                 result["value"] = language_server.request_completions(file_path, 15, 10)
             except Exception as e:
@@ -167,7 +159,7 @@ class TestFSharpLanguageServer:
     @pytest.mark.parametrize("language_server", [Language.FSHARP], indirect=True)
     def test_diagnostics(self, language_server: SolidLanguageServer) -> None:
         """Test getting diagnostics (errors, warnings) from F# files."""
-        file_path = os.path.join("Program.fs")
+        file_path = PROGRAM_FS
 
         # FsAutoComplete uses publishDiagnostics notifications instead of textDocument/diagnostic requests
         # So we'll test that the language server can handle files without crashing
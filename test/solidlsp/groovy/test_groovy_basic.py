@@ -1,81 +1,58 @@
 import os
-from pathlib import Path
+from collections.abc import Iterator
 
 import pytest
 
-from serena.constants import SERENA_MANAGED_DIR_NAME
 from solidlsp import SolidLanguageServer
-from solidlsp.ls_config import Language, LanguageServerConfig
+from solidlsp.ls_config import Language
 from solidlsp.ls_utils import SymbolUtils
-from solidlsp.settings import SolidLSPSettings
+from test.conftest import get_repo_path, index_references_by_file_name, start_ls_context
+
+UTILS_GROOVY = os.path.join("src", "main", "groovy", "com", "example", "Utils.groovy")
+MODEL_GROOVY = os.path.join("src", "main", "groovy", "com", "example", "Model.groovy")
+
+
+# Note: using module scope (like the generic language_server fixture) to start the JVM-based server only once for all tests
+@pytest.fixture(scope="module")
+def groovy_language_server() -> Iterator[SolidLanguageServer]:
+    """
+    Groovy language server for the Groovy test repository, using the JAR given by the GROOVY_LS_JAR_PATH environment variable
+    """
+    if not get_repo_path(Language.GROOVY).exists():
+        pytest.skip("Groovy test repository not found")
+
+    # Use JAR path from environment variable
+    ls_jar_path = os.environ.get("GROOVY_LS_JAR_PATH")
+    if not ls_jar_path or not os.path.exists(ls_jar_path):
+        pytest.skip("Groovy Language Server JAR not found. Set GROOVY_LS_JAR_PATH environment variable to run tests.")
+
+    # Get JAR options from environment variable
+    ls_jar_options = os.environ.get("GROOVY_LS_JAR_OPTIONS", "")
+    ls_java_home_path = os.environ.get("GROOVY_LS_JAVA_HOME_PATH")
+
+    groovy_settings = {"ls_jar_path": ls_jar_path, "ls_jar_options": ls_jar_options}
+    if ls_java_home_path:
+        groovy_settings["ls_java_home_path"] = ls_java_home_path
+
+    with start_ls_context(Language.GROOVY, ls_specific_settings={Language.GROOVY: groovy_settings}) as ls:
+        yield ls
 
 
 @pytest.mark.groovy
+@pytest.mark.xdist_group("groovy")
 class TestGroovyLanguageServer:
-    language_server: SolidLanguageServer | None = None
-    test_repo_path: Path = Path(__file__).parent.parent.parent / "resources" / "repos" / "groovy" / "test_repo"
-
-    @classmethod
-    def setup_class(cls):
-        """
-        Set up test class with Groovy test repository.
-        """
-        if not cls.test_repo_path.exists():
-            pytest.skip("Groovy test repository not found")
-
-        # Use JAR path from environment variable
-        ls_jar_path = os.environ.get("GROOVY_LS_JAR_PATH")
-        if not ls_jar_path or not os.path.exists(ls_jar_path):
-            pytest.skip(
-                "Groovy Language Server JAR not found. Set GROOVY_LS_JAR_PATH environment variable to run tests.",
-                allow_module_level=True,
-            )
-
-        # Get JAR options from environment variable
-        ls_jar_options = os.environ.get("GROOVY_LS_JAR_OPTIONS", "")
-        ls_java_home_path = os.environ.get("GROOVY_LS_JAVA_HOME_PATH")
-
-        groovy_settings = {"ls_jar_path": ls_jar_path, "ls_jar_options": ls_jar_options}
-        if ls_java_home_path:
-            groovy_settings["ls_java_home_path"] = ls_java_home_path
-
-        # Create language server directly with Groovy-specific settings
-        repo_path = str(cls.test_repo_path)
-        config = LanguageServerConfig(code_language=Language.GROOVY, ignored_paths=[], trace_lsp_communication=False)
-
-        solidlsp_settings = SolidLSPSettings(
-            solidlsp_dir=str(Path.home() / ".serena"),
-            project_data_relative_path=SERENA_MANAGED_DIR_NAME,
-            ls_specific_settings={Language.GROOVY: groovy_settings},
-        )
-
-        cls.language_server = SolidLanguageServer.create(config, repo_path, solidlsp_settings=solidlsp_settings)
-        cls.language_server.start()
-
-    @classmethod
-    def teardown_class(cls):
-        """
-        Clean up language server.
-        """
-        if cls.language_server is not None:
-            cls.language_server.stop()
-
-    def test_find_symbol(self) -> None:
-        assert self.language_server is not None
-        symbols = self.language_server.request_full_symbol_tree()
-        assert SymbolUtils.symbol_tree_contains_name(symbols, "Main"), "Main class not found in symbol tree"
-        assert SymbolUtils.symbol_tree_contains_name(symbols, "Utils"), "Utils class not found in symbol tree"
-        assert SymbolUtils.symbol_tree_contains_name(symbols, "Model"), "Model class not found in symbol tree"
-        assert SymbolUtils.symbol_tree_contains_name(symbols, "ModelUser"), "ModelUser class not found in symbol tree"
-
-    def test_find_referencing_class_symbols(self) -> None:
-        assert self.language_server is not None
-        file_path = os.path.join("src", "main", "groovy", "com", "example", "Utils.groovy")
-        refs = self.language_server.request_references(file_path, 3, 6)
-        assert any("Main.groovy" in ref.get("relativePath", "") for ref in refs), "Utils should be referenced from Main.groovy"
-
-        file_path = os.path.join("src", "main", "groovy", "com", "example", "Model.groovy")
-        symbols = self.language_server.request_document_symbols(file_path).get_all_symbols_and_roots()
+    def test_find_symbol(self, groovy_language_server: SolidLanguageServer) -> None:
+        symbols = groovy_language_server.request_full_symbol_tree()
+        missing_names = SymbolUtils.symbol_tree_contains_all(symbols, {"Main", "Utils", "Model", "ModelUser"})
+        assert not missing_names, f"Classes {missing_names} not found in symbol tree"
+
+    def test_find_referencing_class_symbols(self, groovy_language_server: SolidLanguageServer) -> None:
+        file_path = UTILS_GROOVY
+        refs = groovy_language_server.request_references(file_path, 3, 6)
+        assert "Main.groovy" in index_references_by_file_name(refs), "Utils should be referenced from Main.groovy"
+
+        file_path = MODEL_GROOVY
+        symbols = groovy_language_server.request_document_symbols(file_path).get_all_symbols_and_roots()
         model_symbol = None
         for sym in symbols[0]:
             if sym.get("name") == "com.example.Model" and sym.get("kind") == 5:
@@ -87,18 +64,16 @@ class TestGroovyLanguageServer:
             sel_start = model_symbol["selectionRange"]["start"]
         else:
             sel_start = model_symbol["range"]["start"]
-        refs = self.language_server.request_references(file_path, sel_start["line"], sel_start["character"])
+        refs = groovy_language_server.request_references(file_path, sel_start["line"], sel_start["character"])
 
-        main_refs = [ref for ref in refs if "Main.groovy" in ref.get("relativePath", "")]
-        assert len(main_refs) >= 2, f"Model should be referenced from Main.groovy at least 2 times, found {len(main_refs)}"
+        ref_lines_by_file = index_references_by_file_name(refs)
+        main_ref_count = len(ref_lines_by_file.get("Main.groovy", []))
+        assert main_ref_count >= 2, f"Model should be referenced from Main.groovy at least 2 times, found {main_ref_count}"
 
-        model_user_refs = [ref for ref in refs if "ModelUser.groovy" in ref.get("relativePath", "")]
-        assert len(model_user_refs) >= 1, f"Model should be referenced from ModelUser.groovy at least 1 time, found {len(model_user_refs)}"
+        model_user_ref_count = len(ref_lines_by_file.get("ModelUser.groovy", []))
+        assert model_user_ref_count >= 1, f"Model should be referenced from ModelUser.groovy at least 1 time, found {model_user_ref_count}"
 
-    def test_overview_methods(self) -> None:
-        assert self.language_server is not None
-        symbols = self.language_server.request_full_symbol_tree()
-        assert SymbolUtils.symbol_tree_contains_name(symbols, "Main"), "Main missing from overview"
-        assert SymbolUtils.symbol_tree_contains_name(symbols, "Utils"), "Utils missing from overview"
-        assert SymbolUtils.symbol_tree_contains_name(symbols, "Model"), "Model missing from overview"
-        assert SymbolUtils.symbol_tree_contains_name(symbols, "ModelUser"), "ModelUser missing from overview"
+    def test_overview_methods(self, groovy_language_server: SolidLanguageServer) -> None:
+        symbols = groovy_language_server.request_full_symbol_tree()
+        missing_names = SymbolUtils.symbol_tree_contains_all(symbols, {"Main", "Utils", "Model", "ModelUser"})
+        assert not missing_names, f"Classes {missing_names} missing from overview"
@@ -10,31 +10,39 @@ import pytest
 from solidlsp import SolidLanguageServer
 from solidlsp.ls_config import Language
 from solidlsp.ls_types import SymbolKind
+from test.conftest import index_references_by_file_name
+
+CALCULATOR_LUA = "src/calculator.lua"
+UTILS_LUA = "src/utils.lua"
+MAIN_LUA = "main.lua"
+TEST_CALCULATOR_LUA = "tests/test_calculator.lua"
+
+
+def _dict_symbols(symbol_list: list) -> list[dict]:
+    """
+    :param symbol_list: a list of symbols as returned by the language server
+    :return: the symbols in the list which are dictionaries
+    """
+    return [s for s in symbol_list if isinstance(s, dict)]
 
 
 @pytest.mark.lua
+@pytest.mark.xdist_group("lua")
 class TestLuaLanguageServer:
     """Test Lua language server symbol finding and cross-file references."""
 
     @pytest.mark.parametrize("language_server", [Language.LUA], indirect=True)
     def test_find_symbols_in_calculator(self, language_server: SolidLanguageServer) -> None:
         """Test finding specific functions in calculator.lua."""
-        symbols = language_server.request_document_symbols("src/calculator.lua").get_all_symbols_and_roots()
+        symbols = language_server.request_document_symbols(CALCULATOR_LUA).get_all_symbols_and_roots()
 
         assert symbols is not None
         assert len(symbols) > 0
 
         # Extract function names from the returned structure
         symbol_list = symbols[0] if isinstance(symbols, tuple) else symbols
-        function_names = set()
-        for symbol in symbol_list:
-            if isinstance(symbol, dict):
-                name = symbol.get("name", "")
-                # Handle both plain names and module-prefixed names
-                if "." in name:
-                    name = name.split(".")[-1]
-                if symbol.get("kind") == SymbolKind.Function:
-                    function_names.add(name)
+        # Handle both plain names and module-prefixed names
+        function_names = {s.get("name", "").rpartition(".")[2] for s in _dict_symbols(symbol_list) if s.get("kind") == SymbolKind.Function}
 
         # Verify exact calculator functions exist
         expected_functions = {"add", "subtract", "multiply", "divide", "factorial"}
@@ -49,24 +57,16 @@ class TestLuaLanguageServer:
     @pytest.mark.parametrize("language_server", [Language.LUA], indirect=True)
     def test_find_symbols_in_utils(self, language_server: SolidLanguageServer) -> None:
         """Test finding specific functions in utils.lua."""
-        symbols = language_server.request_document_symbols("src/utils.lua").get_all_symbols_and_roots()
+        symbols = language_server.request_document_symbols(UTILS_LUA).get_all_symbols_and_roots()
 
         assert symbols is not None
         assert len(symbols) > 0
 
         symbol_list = symbols[0] if isinstance(symbols, tuple) else symbols
-        function_names = set()
-        all_symbols = set()
-
-        for symbol in symbol_list:
-            if isinstance(symbol, dict):
-                name = symbol.get("name", "")
-                all_symbols.add(name)
-                # Handle both plain names and module-prefixed names
-                if "." in name:
-                    name = name.split(".")[-1]
-                if symbol.get("kind") == SymbolKind.Function:
-                    function_names.add(name)
+        dict_symbols = _dict_symbols(symbol_list)
+        all_symbols = {s.get("name", "") for s in dict_symbols}
+        # Handle both plain names and module-prefixed names
+        function_names = {s.get("name", "").rpartition(".")[2] for s in dict_symbols if s.get("kind") == SymbolKind.Function}
 
         # Verify exact string utility functions
         expected_utils = {"trim", "split", "starts_with", "ends_with"}
@@ -84,17 +84,13 @@ class TestLuaLanguageServer:
     @pytest.mark.parametrize("language_server", [Language.LUA], indirect=True)
     def test_find_symbols_in_main(self, language_server: SolidLanguageServer) -> None:
         """Test finding functions in main.lua."""
-        symbols = language_server.request_document_symbols("main.lua").get_all_symbols_and_roots()
+        symbols = language_server.request_document_symbols(MAIN_LUA).get_all_symbols_and_roots()
 
         assert symbols is not None
         assert len(symbols) > 0
 
         symbol_list = symbols[0] if isinstance(symbols, tuple) else symbols
-        function_names = set()
-
-        for symbol in symbol_list:
-            if isinstance(symbol, dict) and symbol.get("kind") == SymbolKind.Function:
-                function_names.add(symbol.get("name", ""))
+        function_names = {s.get("name", "") for s in _dict_symbols(symbol_list) if s.get("kind") == SymbolKind.Function}
 
         # Verify exact main functions exist
         expected_funcs = {"print_banner", "test_calculator", "test_utils"}
@@ -107,19 +103,13 @@ class TestLuaLanguageServer:
     @pytest.mark.parametrize("language_server", [Language.LUA], indirect=True)
     def test_cross_file_references_calculator_add(self, language_server: SolidLanguageServer) -> None:
         """Test finding cross-file references to calculator.add function."""
-        symbols = language_server.request_document_symbols("src/calculator.lua").get_all_symbols_and_roots()
+        symbols = language_server.request_document_symbols(CALCULATOR_LUA).get_all_symbols_and_roots()
 
         assert symbols is not None
         symbol_list = symbols[0] if isinstance(symbols, tuple) else symbols
 
         # Find the add function
-        add_symbol = None
-        for sym in symbol_list:
-            if isinstance(sym, dict):
-                name = sym.get("name", "")
-                if "add" in name or name == "add":
-                    add_symbol = sym
-                    break
+        add_symbol = next((sym for sym in _dict_symbols(symbol_list) if "add" in sym.get("name", "")), None)
 
         assert add_symbol is not None, "add function not found in calculator.lua"
 
@@ -128,7 +118,7 @@ class TestLuaLanguageServer:
         assert range_info is not None, "add function has no range information"
 
         range_start = range_info["start"]
-        refs = language_server.request_references("src/calculator.lua", range_start["line"], range_start["character"])
+        refs = language_server.request_references(CALCULATOR_LUA, range_start["line"], range_start["character"])
 
         assert refs is not None
         assert isinstance(refs, list)
@@ -137,12 +127,7 @@ class TestLuaLanguageServer:
         assert len(refs) >= 5, f"Should find at least 5 references to calculator.add, found {len(refs)}"
 
         # Verify exact reference locations
-        ref_files: dict[str, list[int]] = {}
-        for ref in refs:
-            filename = ref.get("uri", "").split("/")[-1]
-            if filename not in ref_files:
-                ref_files[filename] = []
-            ref_files[filename].append(ref["range"]["start"]["line"])
+        ref_files = index_references_by_file_name(refs)
 
         # The declaration may or may not be included
         if "calculator.lua" in ref_files:
@@ -156,26 +141,16 @@ class TestLuaLanguageServer:
             15 in ref_files["main.lua"] or 70 in ref_files["main.lua"]
         ), f"Should find add usage in main.lua, found at lines {ref_files.get('main.lua', [])}"
 
-        # Check for cross-file references from main.lua
-        main_refs = [ref for ref in refs if "main.lua" in ref.get("uri", "")]
-        assert len(main_refs) > 0, "calculator.add should be called in main.lua"
-
     @pytest.mark.parametrize("language_server", [Language.LUA], indirect=True)
     def test_cross_file_references_utils_trim(self, language_server: SolidLanguageServer) -> None:
         """Test finding cross-file references to utils.trim function."""
-        symbols = language_server.request_document_symbols("src/utils.lua").get_all_symbols_and_roots()
+        symbols = language_server.request_document_symbols(UTILS_LUA).get_all_symbols_and_roots()
 
         assert symbols is not None
         symbol_list = symbols[0] if isinstance(symbols, tuple) else symbols
 
         # Find the trim function
-        trim_symbol = None
-        for sym in symbol_list:
-            if isinstance(sym, dict):
-                name = sym.get("name", "")
-                if "trim" in name or name == "trim":
-                    trim_symbol = sym
-                    break
+        trim_symbol = next((sym for sym in _dict_symbols(symbol_list) if "trim" in sym.get("name", "")), None)
 
         assert trim_symbol is not None, "trim function not found in utils.lua"
 
@@ -184,7 +159,7 @@ class TestLuaLanguageServer:
         assert range_info is not None, "trim function has no range information"
 
         range_start = range_info["start"]
-        refs = language_server.request_references("src/utils.lua", range_start["line"], range_start["character"])
+        refs = language_server.request_references(UTILS_LUA, range_start["line"], range_start["character"])
 
         assert refs is not None
         assert isinstance(refs, list)
@@ -193,12 +168,7 @@ class TestLuaLanguageServer:
         assert len(refs) >= 1, f"Should find at least 1 reference to utils.trim, found {len(refs)}"
 
         # Verify exact reference locations
-        ref_files: dict[str, list[int]] = {}
-        for ref in refs:
-            filename = ref.get("uri", "").split("/")[-1]
-            if filename not in ref_files:
-                ref_files[filename] = []
-            ref_files[filename].append(ref["range"]["start"]["line"])
+        ref_files = index_references_by_file_name(refs)
 
         # The declaration may or may not be included
         if "utils.lua" in ref_files:
@@ -212,15 +182,11 @@ class TestLuaLanguageServer:
             31 in ref_files["main.lua"]
         ), f"Should find trim usage at line 32 (0-indexed: 31) in main.lua, found at lines {ref_files.get('main.lua', [])}"
 
-        # Check for cross-file references from main.lua
-        main_refs = [ref for ref in refs if "main.lua" in ref.get("uri", "")]
-        assert len(main_refs) > 0, "utils.trim should be called in main.lua"
-
     @pytest.mark.parametrize("language_server", [Language.LUA], indirect=True)
     def test_hover_information(self, language_server: SolidLanguageServer) -> None:
         """Test hover information for symbols."""
         # Get hover info for a function
-        hover_info = language_server.request_hover("src/calculator.lua", 5, 10)  # Position near add function
+        hover_info = language_server.request_hover(CALCULATOR_LUA, 5, 10)  # Position near add function
 
         assert hover_info is not None, "Should provide hover information"
 
@@ -245,7 +211,7 @@ class TestLuaLanguageServer:
     def test_references_between_test_and_source(self, language_server: SolidLanguageServer) -> None:
         """Test finding references from test files to source files."""
         # Check if test_calculator.lua references calculator module
-        test_symbols = language_server.request_document_symbols("tests/test_calculator.lua").get_all_symbols_and_roots()
+        test_symbols = language_server.request_document_symbols(TEST_CALCULATOR_LUA).get_all_symbols_and_roots()
 
         assert test_symbols is not None
         assert len(test_symbols) > 0
@@ -5,21 +5,36 @@ These tests validate symbol finding and cross-file reference capabilities for Ni
 """
 
 import platform
+from collections.abc import Iterator
 
 import pytest
 
 from solidlsp import SolidLanguageServer
 from solidlsp.ls_config import Language
-from test.conftest import is_ci
+from test.conftest import is_ci, open_files
 
 # Skip all Nix tests on Windows as Nix doesn't support Windows
 pytestmark = pytest.mark.skipif(platform.system() == "Windows", reason="Nix and nil are not available on Windows")
 
 
+def _symbol_names(symbols: tuple[list, list] | list) -> set[str | None]:
+    """
+    :param symbols: the result of `get_all_symbols_and_roots` (or a plain list of symbols)
+    :return: the names of all symbols
+    """
+    symbol_list = symbols[0] if isinstance(symbols, tuple) else symbols
+    return {sym.get("name") for sym in symbol_list if isinstance(sym, dict)}
+
+
 @pytest.mark.nix
 class TestNixLanguageServer:
     """Test Nix language server symbol finding capabilities."""
 
+    @pytest.fixture(scope="class", autouse=True)
+    def open_source_files(self, language_server: SolidLanguageServer) -> Iterator[None]:
+        with open_files(language_server, ["default.nix", "lib/utils.nix", "flake.nix", "modules/example.nix"]):
+            yield
+
     @pytest.mark.parametrize("language_server", [Language.NIX], indirect=True)
     def test_find_symbols_in_default_nix(self, language_server: SolidLanguageServer) -> None:
         """Test finding specific symbols in default.nix."""
@@ -29,8 +44,7 @@ class TestNixLanguageServer:
         assert len(symbols) > 0
 
         # Extract symbol names from the returned structure
-        symbol_list = symbols[0] if isinstance(symbols, tuple) else symbols
-        symbol_names = {sym.get("name") for sym in symbol_list if isinstance(sym, dict)}
+        symbol_names = _symbol_names(symbols)
 
         # Verify specific function exists
         assert "makeGreeting" in symbol_names, "makeGreeting function not found"
@@ -48,8 +62,7 @@ class TestNixLanguageServer:
         assert symbols is not None
         assert len(symbols) > 0
 
-        symbol_list = symbols[0] if isinstance(symbols, tuple) else symbols
-        symbol_names = {sym.get("name") for sym in symbol_list if isinstance(sym, dict)}
+        symbol_names = _symbol_names(symbols)
 
         # Verify exact utility modules are found
         expected_modules = {"math", "strings", "lists", "attrs"}
@@ -64,8 +77,7 @@ class TestNixLanguageServer:
         assert symbols is not None
         assert len(symbols) > 0
 
-        symbol_list = symbols[0] if isinstance(symbols, tuple) else symbols
-        symbol_names = {sym.get("name") for sym in symbol_list if isinstance(sym, dict)}
+        symbol_names = _symbol_names(symbols)
 
         # Flakes must have either inputs or outputs
         assert "inputs" in symbol_names or "outputs" in symbol_names, "Flake must have inputs or outputs"
@@ -78,8 +90,7 @@ class TestNixLanguageServer:
         assert symbols is not None
         assert len(symbols) > 0
 
-        symbol_list = symbols[0] if isinstance(symbols, tuple) else symbols
-        symbol_names = {sym.get("name") for sym in symbol_list if isinstance(sym, dict)}
+        symbol_names = _symbol_names(symbols)
 
         # NixOS modules must have either options or config
         assert "options" in symbol_names or "config" in symbol_names, "Module must have options or config"
@@ -159,17 +170,15 @@ class TestNixLanguageServer:
         symbols = language_server.request_document_symbols("default.nix").get_all_symbols_and_roots()
 
         assert symbols is not None
-        symbol_list = symbols[0] if isinstance(symbols, tuple) else symbols
 
         # Check that makeGreeting exists (defined in default.nix)
-        symbol_names = {sym.get("name") for sym in symbol_list if isinstance(sym, dict)}
+        symbol_names = _symbol_names(symbols)
         assert "makeGreeting" in symbol_names, "makeGreeting should be found in default.nix"
 
         # Verify lib/utils.nix has the expected structure
         utils_symbols = language_server.request_document_symbols("lib/utils.nix").get_all_symbols_and_roots()
         assert utils_symbols is not None
-        utils_list = utils_symbols[0] if isinstance(utils_symbols, tuple) else utils_symbols
-        utils_names = {sym.get("name") for sym in utils_list if isinstance(sym, dict)}
+        utils_names = _symbol_names(utils_symbols)
 
         # Verify key functions exist in utils
         assert "math" in utils_names, "math should be found in lib/utils.nix"
@@ -1,10 +1,11 @@
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
 from solidlsp import SolidLanguageServer
 from solidlsp.ls_config import Language
-from test.conftest import is_ci, is_windows, language_tests_enabled
+from test.conftest import is_ci, is_windows, language_tests_enabled, open_files
 
 _php_servers: list[Language] = [Language.PHP]
 if language_tests_enabled(Language.PHP_PHPACTOR):
@@ -14,6 +15,11 @@ if language_tests_enabled(Language.PHP_PHPACTOR):
 
 @pytest.mark.php
 class TestPhpLanguageServers:
+    @pytest.fixture(scope="class", autouse=True)
+    def open_source_files(self, language_server: SolidLanguageServer) -> Iterator[None]:
+        with open_files(language_server, ["index.php", "helper.php", "simple_var.php"]):
+            yield
+
     @pytest.mark.parametrize("language_server", _php_servers, indirect=True)
     @pytest.mark.parametrize("repo_path", [Language.PHP], indirect=True)
     def test_ls_is_running(self, language_server: SolidLanguageServer, repo_path: Path) -> None: